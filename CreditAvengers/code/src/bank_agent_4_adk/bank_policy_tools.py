@@ -1,11 +1,179 @@
+import codecs
 import json
+import logging
+import math
 import sys
 import os
 import requests
-import re
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from uuid import uuid4
 from .wfap_protocol import BANK_POLICIES
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, TypedDict, Union
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # Only needed for bulk underwriting
+    np = None
+    pd = None
+
+try:
+    import re2 as re  # Linear-time, GIL-releasing matching for large ESG reports
+except ImportError:
+    import re
+
+try:
+    import numba
+except ImportError:  # The fused scoring kernel then runs as plain Python
+    numba = None
+
+try:
+    import ahocorasick
+except ImportError:  # Certifications and purposes are then scanned with str.find / re, same results
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+# Carbon emissions patterns used when parsing ESG reports, e.g. "Carbon Emissions = 450",
+# in priority order: a "Carbon" figure wins over "Total", and "Total" over "CO2", wherever
+# each appears in the report (inline flags so the same patterns compile under both re2 and re)
+_EMISSIONS_PATTERNS = tuple(
+    re.compile(rf'(?i){keyword}\s+emissions\s*[=:]\s*(\d+(?:\.\d+)?)')
+    for keyword in ("carbon", "total", "co2")
+)
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+
+# Parsed ESG report results keyed by URL: (etag, last_modified, carbon_emissions)
+_ESG_REPORT_CACHE: Dict[str, tuple] = {}
+_ESG_REPORT_CACHE_SIZE = 512
+
+# Streaming limits for ESG report downloads
+_ESG_REPORT_CHUNK_SIZE = 8192
+_ESG_REPORT_MAX_CHARS = 1024 * 1024
+_ESG_REPORT_SCAN_OVERLAP = 256  # Re-scan this much of the previous chunk for matches split across chunks
+
+# Shared HTTP session so repeated ESG report downloads reuse pooled TCP/TLS connections
+_SESSION = requests.Session()
+_ESG_HTTP_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+_SESSION.mount("https://", _ESG_HTTP_ADAPTER)
+_SESSION.mount("http://", _ESG_HTTP_ADAPTER)
+
+# Background ESG report downloads, overlapped with the local risk calculations
+_ESG_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="esg-fetch")
+
+# Acceptable jurisdictions for corporate lending (uppercased for lookup)
+_ACCEPTABLE_JURISDICTIONS = frozenset({
+    "US", "USA", "UNITED STATES",
+    "CA", "CANADA",
+    "UK", "UNITED KINGDOM",
+    "DE", "GERMANY",
+    "FR", "FRANCE",
+    "AU", "AUSTRALIA",
+    "JP", "JAPAN"
+})
+
+# High-risk jurisdictions
+_HIGH_RISK_JURISDICTIONS = frozenset({
+    "AF", "BY", "CF", "CU", "ER", "HK", "IR", "IQ", "KP", "LB", "LY", "MM", "NI", "RU", "SO", "SS", "SD", "SY", "VE", "YE", "ZW"
+})
+
+# Prohibited industries as a set for O(1) membership tests (policy list is fixed at import)
+_PROHIBITED_INDUSTRIES = frozenset(BANK_POLICIES.prohibited_industries)
+
+# Map industry codes to our internal risk classifications
+_INDUSTRY_MAPPING: Mapping[str, str] = MappingProxyType({
+    "621": "healthcare_services",  # Healthcare
+    "221": "utilities",           # Utilities
+    "311": "food_processing",     # Food Manufacturing
+    "541": "professional_services", # Professional Services
+    "518": "technology_software",  # Software
+    "336": "manufacturing",       # Manufacturing
+    "441": "retail_trade",        # Retail
+    "484": "transportation",      # Transportation
+    "236": "construction",        # Construction
+    "423": "wholesale_trade",     # Wholesale
+    "211": "oil_gas",            # Oil & Gas
+    "212": "mining",             # Mining
+    "111": "agriculture",        # Agriculture
+    "721": "hospitality",        # Hospitality
+    "531": "real_estate",        # Real Estate
+    "522": "cryptocurrency",     # Crypto/Fintech
+    "713": "gambling",           # Gambling
+    "812": "adult_entertainment", # Adult Entertainment
+    "111998": "cannabis"         # Cannabis
+})
+
+# Industry benchmarks for carbon intensity (tons CO2e per $M revenue)
+_INDUSTRY_BENCHMARKS: Mapping[str, int] = MappingProxyType({
+    "541": 10,    # Software Development
+    "518": 10,    # Technology/Software  
+    "311": 250,   # Food Manufacturing
+    "336": 180,   # Manufacturing (Auto)
+    "441": 80,    # Auto Dealerships
+    "221": 400,   # Utilities
+    "211": 600,   # Oil & Gas
+    "212": 500,   # Mining
+    "236": 120,   # Construction
+    "484": 150,   # Transportation
+    "621": 25,    # Healthcare Services
+    "721": 60,    # Hospitality
+    "423": 40,    # Wholesale Trade
+    "531": 30,    # Real Estate
+    "713": 50,    # Entertainment/Gambling
+    "111": 200    # Agriculture
+})
+
+
+def _parse_carbon_emissions(content: str) -> float:
+    """Extract the carbon emissions figure from ESG report text.
+    
+    >>> _parse_carbon_emissions("Total Emissions: 5\\nCarbon Emissions: 450")
+    450.0
+    """
+    
+    # Look for patterns like "Carbon Emissions = 450" or "Carbon Emissions: 450"
+    for pattern in _EMISSIONS_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            return float(match.group(1))
+    
+    # If no pattern matches, take the first standalone number as a fallback
+    match = _NUMBER_RE.search(content)
+    if match:
+        return float(match.group(0))
+    
+    # If nothing found, return 0
+    return 0.0
+
+
+def _scan_streamed_report(response: "requests.Response") -> float:
+    """Read a streamed ESG report until the top-priority emissions pattern matches or the size cap is hit."""
+    
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    content = ""
+    for chunk in response.iter_content(chunk_size=_ESG_REPORT_CHUNK_SIZE):
+        scan_from = max(0, len(content) - _ESG_REPORT_SCAN_OVERLAP)
+        content += decoder.decode(chunk)
+        # Only a "Carbon" figure can stop the download early; lower-priority figures are
+        # resolved by _parse_carbon_emissions once the whole report has been read
+        match = _EMISSIONS_PATTERNS[0].search(content, scan_from)
+        # A match at the end of the buffer may still be missing digits from the next chunk
+        if match and match.end() + 1 < len(content):
+            return float(match.group(1))
+        if len(content) >= _ESG_REPORT_MAX_CHARS:
+            return _parse_carbon_emissions(content[:_ESG_REPORT_MAX_CHARS])
+    
+    return _parse_carbon_emissions(content + decoder.decode(b"", final=True))
+
 
 def fetch_carbon_emissions_from_esg_report(esg_reporting_url: str) -> float:
     """
@@ -18,54 +186,70 @@ def fetch_carbon_emissions_from_esg_report(esg_reporting_url: str) -> float:
         Carbon emissions value in tons CO2e
     """
     
-    if not esg_reporting_url or esg_reporting_url.lower() in ["", "none", "null"]:
+    # Only a short string can be a "none"/"null" placeholder, so long URLs are never lowercased
+    if not esg_reporting_url or (len(esg_reporting_url) <= 4 and esg_reporting_url.lower() in ("none", "null")):
         return 0.0  # Default to 0 if no URL provided
     
     try:
-        # Fetch the ESG report content
-        response = requests.get(esg_reporting_url, timeout=10)
-        response.raise_for_status()
-        
-        content = response.text
-        
-        # Parse carbon emissions from the content
-        # Look for patterns like "Carbon Emissions = 450" or "Carbon Emissions: 450"
-        patterns = [
-            r'Carbon\s+Emissions\s*[=:]\s*(\d+(?:\.\d+)?)',
-            r'carbon\s+emissions\s*[=:]\s*(\d+(?:\.\d+)?)',
-            r'Total\s+Emissions\s*[=:]\s*(\d+(?:\.\d+)?)',
-            r'total\s+emissions\s*[=:]\s*(\d+(?:\.\d+)?)',
-            r'CO2\s+Emissions\s*[=:]\s*(\d+(?:\.\d+)?)',
-            r'co2\s+emissions\s*[=:]\s*(\d+(?:\.\d+)?)'
-        ]
+        # Revalidate a previously parsed report instead of downloading it again
+        cached = _ESG_REPORT_CACHE.get(esg_reporting_url)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                emissions_value = float(match.group(1))
-                return emissions_value
+        # Stream the ESG report and stop reading as soon as the emissions line is found
+        with _SESSION.get(esg_reporting_url, headers=headers, timeout=10, stream=True) as response:
+            if cached and response.status_code == 304:
+                return cached[2]
+            response.raise_for_status()
+            
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            emissions_value = _scan_streamed_report(response)
         
-        # If no pattern matches, try to find any number that might be emissions
-        # This is a fallback - look for standalone numbers
-        numbers = re.findall(r'\b(\d+(?:\.\d+)?)\b', content)
-        if numbers:
-            # Take the first number found as a fallback
-            return float(numbers[0])
+        if etag or last_modified:
+            if esg_reporting_url not in _ESG_REPORT_CACHE and len(_ESG_REPORT_CACHE) >= _ESG_REPORT_CACHE_SIZE:
+                _ESG_REPORT_CACHE.pop(next(iter(_ESG_REPORT_CACHE)), None)
+            _ESG_REPORT_CACHE[esg_reporting_url] = (etag, last_modified, emissions_value)
         
-        # If nothing found, return 0
-        return 0.0
+        return emissions_value
         
     except requests.RequestException as e:
-        print(f"Warning: Failed to fetch ESG report from {esg_reporting_url}: {str(e)}")
+        logger.warning("Failed to fetch ESG report from %s: %s", esg_reporting_url, e)
         return 0.0  # Return 0 if URL fetch fails
     except ValueError as e:
-        print(f"Warning: Failed to parse carbon emissions from ESG report: {str(e)}")
+        logger.warning("Failed to parse carbon emissions from ESG report: %s", e)
         return 0.0
     except Exception as e:
-        print(f"Warning: Unexpected error fetching ESG report: {str(e)}")
+        logger.warning("Unexpected error fetching ESG report: %s", e)
         return 0.0
 
 
+@dataclass(frozen=True, slots=True)
+class CheckResult:
+    """Immutable outcome of a single initial risk check"""
+    check: str
+    status: str
+    reason: str
+    extras: tuple = ()  # (field, value) pairs reported after check/status/reason
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary format returned by the agent tools"""
+        result = {"check": self.check, "status": self.status, "reason": self.reason}
+        for field_name, value in self.extras:
+            result[field_name] = list(value) if isinstance(value, tuple) else value
+        return result
+
+
+def _check_result(check: str, status: str, reason: str, **extras: Any) -> CheckResult:
+    """Build a CheckResult, keeping extra fields in keyword order"""
+    return CheckResult(check, status, reason, tuple(extras.items()))
+
+
 def perform_initial_risk_assessment(
     intent_id: str,
     sender_name: str,
@@ -75,11 +259,16 @@ def perform_initial_risk_assessment(
     financials_annual_revenue: float,
     financials_net_income: float,
     financials_assets_total: float,
-    financials_liabilities_total: float
+    financials_liabilities_total: float,
+    fast_fail: bool = False
 ) -> Dict[str, Any]:
     """
     Performs initial risk assessment for corporate line of credit application.
     
+    Args:
+        fast_fail: Stop at the first failed check instead of running all of them
+            (useful for bulk pre-screening; the default reports every check)
+    
     Returns:
         Dictionary with assessment result (PASS/FAIL) and detailed reasons
     """
@@ -88,55 +277,25 @@ def perform_initial_risk_assessment(
     overall_status = "PASS"
     
     try:
-        # 1. INDUSTRY ELIGIBILITY CHECK
-        industry_status = check_industry_eligibility(industry_code)
-        assessment_results.append(industry_status)
-        if industry_status["status"] == "FAIL":
-            overall_status = "FAIL"
-            print("1 -Fail")
-        
-        # 2. LOAN AMOUNT LIMITS CHECK
-        amount_status = check_loan_amount_limits(amount_value)
-        assessment_results.append(amount_status)
-        if amount_status["status"] == "FAIL":
-            overall_status = "FAIL"
-            print("2 -Fail")
-        
-        # 3. GEOGRAPHIC/JURISDICTION CHECK
-        jurisdiction_status = check_jurisdiction_eligibility(jurisdiction)
-        assessment_results.append(jurisdiction_status)
-        if jurisdiction_status["status"] == "FAIL":
-            overall_status = "FAIL"
-            print("3 -Fail")
-        
-        # 4. MINIMUM REVENUE CHECK
-        revenue_status = check_minimum_revenue(financials_annual_revenue)
-        assessment_results.append(revenue_status)
-        if revenue_status["status"] == "FAIL":
-            overall_status = "FAIL"
-            print("4 -Fail")
-        
-        # 5. DEBT-TO-ASSET RATIO CHECK
-        debt_ratio_status = check_debt_to_asset_ratio(
-            financials_liabilities_total, 
-            financials_assets_total
-        )
-        assessment_results.append(debt_ratio_status)
-        if debt_ratio_status["status"] == "FAIL":
-            overall_status = "FAIL"
-            print("5 -Fail")
+        check_inputs = {
+            "industry_code": industry_code,
+            "amount_value": amount_value,
+            "jurisdiction": jurisdiction,
+            "financials_annual_revenue": financials_annual_revenue,
+            "financials_net_income": financials_net_income,
+            "financials_assets_total": financials_assets_total,
+            "financials_liabilities_total": financials_liabilities_total,
+        }
         
-        # 6. BASIC FINANCIAL HEALTH CHECKS
-        financial_health_status = check_basic_financial_health(
-            financials_annual_revenue,
-            financials_net_income,
-            financials_assets_total,
-            financials_liabilities_total
-        )
-        assessment_results.append(financial_health_status)
-        if financial_health_status["status"] == "FAIL":
-            overall_status = "FAIL"
-            print("6 -Fail")
+        for check_number, (run_check, input_names) in enumerate(_RISK_CHECKS, start=1):
+            # Results are memoized per check on just the inputs it reads
+            check_status = run_check(*[check_inputs[name] for name in input_names]).to_dict()
+            assessment_results.append(check_status)
+            if check_status["status"] == "FAIL":
+                overall_status = "FAIL"
+                logger.debug("Initial risk check %d failed", check_number)
+                if fast_fail:
+                    break
         
         # Compile final assessment
         passed_checks = len([r for r in assessment_results if r["status"] == "PASS"])
@@ -160,205 +319,176 @@ def perform_initial_risk_assessment(
         }
 
 
-def check_industry_eligibility(industry_code: str) -> Dict[str, Any]:
+@lru_cache(maxsize=256)
+def _industry_prefix(industry_code: str) -> str:
+    """3-digit NAICS prefix (shorter codes unchanged), sliced once per distinct code"""
+    return industry_code[:3]
+
+
+def check_industry_eligibility(industry_code: str) -> CheckResult:
     """Check if the industry is eligible for lending"""
     
-    # Map industry codes to our internal risk classifications
-    industry_mapping = {
-        "621": "healthcare_services",  # Healthcare
-        "221": "utilities",           # Utilities
-        "311": "food_processing",     # Food Manufacturing
-        "541": "professional_services", # Professional Services
-        "518": "technology_software",  # Software
-        "336": "manufacturing",       # Manufacturing
-        "441": "retail_trade",        # Retail
-        "484": "transportation",      # Transportation
-        "236": "construction",        # Construction
-        "423": "wholesale_trade",     # Wholesale
-        "211": "oil_gas",            # Oil & Gas
-        "212": "mining",             # Mining
-        "111": "agriculture",        # Agriculture
-        "721": "hospitality",        # Hospitality
-        "531": "real_estate",        # Real Estate
-        "522": "cryptocurrency",     # Crypto/Fintech
-        "713": "gambling",           # Gambling
-        "812": "adult_entertainment", # Adult Entertainment
-        "111998": "cannabis"         # Cannabis
-    }
-    
     # Get first 3 digits of NAICS code for broad industry classification
-    industry_key = industry_code[:3] if len(industry_code) >= 3 else industry_code
-    mapped_industry = industry_mapping.get(industry_key, "unknown")
+    mapped_industry = _INDUSTRY_MAPPING.get(_industry_prefix(industry_code), "unknown")
     
     # Check if industry is prohibited
-    if mapped_industry in BANK_POLICIES.prohibited_industries:
-        return {
-            "check": "Industry Eligibility",
-            "status": "FAIL",
-            "reason": f"Industry '{mapped_industry}' is on prohibited list",
-            "industry_code": industry_code,
-            "risk_level": "PROHIBITED"
-        }
+    if mapped_industry in _PROHIBITED_INDUSTRIES:
+        return _check_result(
+            "Industry Eligibility",
+            "FAIL",
+            f"Industry '{mapped_industry}' is on prohibited list",
+            industry_code=industry_code,
+            risk_level="PROHIBITED"
+        )
     
     # Check industry risk level
-    if mapped_industry in BANK_POLICIES.industry_risk_levels:
-        risk_level = BANK_POLICIES.industry_risk_levels[mapped_industry]
-        return {
-            "check": "Industry Eligibility", 
-            "status": "PASS",
-            "reason": f"Industry '{mapped_industry}' is acceptable",
-            "industry_code": industry_code,
-            "risk_level": risk_level.value
-        }
+    risk_level = BANK_POLICIES.industry_risk_levels.get(mapped_industry)
+    if risk_level is not None:
+        return _check_result(
+            "Industry Eligibility",
+            "PASS",
+            f"Industry '{mapped_industry}' is acceptable",
+            industry_code=industry_code,
+            risk_level=risk_level.value
+        )
     
     # Unknown industry - treat as medium risk but flag for manual review
-    return {
-        "check": "Industry Eligibility",
-        "status": "PASS",
-        "reason": f"Unknown industry code '{industry_code}' - requires manual review",
-        "industry_code": industry_code,
-        "risk_level": "MEDIUM",
-        "manual_review_required": True
-    }
+    return _check_result(
+        "Industry Eligibility",
+        "PASS",
+        f"Unknown industry code '{industry_code}' - requires manual review",
+        industry_code=industry_code,
+        risk_level="MEDIUM",
+        manual_review_required=True
+    )
 
 
-def check_loan_amount_limits(amount_value: float) -> Dict[str, Any]:
+def check_loan_amount_limits(amount_value: float) -> CheckResult:
     """Check if loan amount is within acceptable limits"""
     
-    if amount_value < BANK_POLICIES.min_credit_limit:
-        return {
-            "check": "Loan Amount Limits",
-            "status": "FAIL", 
-            "reason": f"Requested amount ${amount_value:,.2f} is below minimum ${BANK_POLICIES.min_credit_limit:,.2f}",
-            "requested_amount": amount_value,
-            "min_limit": BANK_POLICIES.min_credit_limit
-        }
+    min_limit = BANK_POLICIES.min_credit_limit
+    max_limit = BANK_POLICIES.max_credit_limit_absolute
     
-    if amount_value > BANK_POLICIES.max_credit_limit_absolute:
-        return {
-            "check": "Loan Amount Limits",
-            "status": "FAIL",
-            "reason": f"Requested amount ${amount_value:,.2f} exceeds maximum ${BANK_POLICIES.max_credit_limit_absolute:,.2f}",
-            "requested_amount": amount_value,
-            "max_limit": BANK_POLICIES.max_credit_limit_absolute
-        }
+    if amount_value < min_limit:
+        return _check_result(
+            "Loan Amount Limits",
+            "FAIL",
+            f"Requested amount ${amount_value:,.2f} is below minimum ${min_limit:,.2f}",
+            requested_amount=amount_value,
+            min_limit=min_limit
+        )
     
-    return {
-        "check": "Loan Amount Limits",
-        "status": "PASS",
-        "reason": f"Requested amount ${amount_value:,.2f} is within acceptable limits",
-        "requested_amount": amount_value,
-        "min_limit": BANK_POLICIES.min_credit_limit,
-        "max_limit": BANK_POLICIES.max_credit_limit_absolute
-    }
+    if amount_value > max_limit:
+        return _check_result(
+            "Loan Amount Limits",
+            "FAIL",
+            f"Requested amount ${amount_value:,.2f} exceeds maximum ${max_limit:,.2f}",
+            requested_amount=amount_value,
+            max_limit=max_limit
+        )
+    
+    return _check_result(
+        "Loan Amount Limits",
+        "PASS",
+        f"Requested amount ${amount_value:,.2f} is within acceptable limits",
+        requested_amount=amount_value,
+        min_limit=min_limit,
+        max_limit=max_limit
+    )
 
 
-def check_jurisdiction_eligibility(jurisdiction: str) -> Dict[str, Any]:
+def check_jurisdiction_eligibility(jurisdiction: str) -> CheckResult:
     """Check if jurisdiction is acceptable for lending"""
     
-    # Acceptable jurisdictions for corporate lending
-    acceptable_jurisdictions = [
-        "US", "USA", "United States",
-        "CA", "Canada", 
-        "UK", "United Kingdom",
-        "DE", "Germany",
-        "FR", "France",
-        "AU", "Australia",
-        "JP", "Japan"
-    ]
-    
-    # High-risk jurisdictions
-    high_risk_jurisdictions = [
-        "AF", "BY", "CF", "CU", "ER", "HK", "IR", "IQ", "KP", "LB", "LY", "MM", "NI", "RU", "SO", "SS", "SD", "SY", "VE", "YE", "ZW"
-    ]
-    
     jurisdiction_upper = jurisdiction.upper()
     
-    if jurisdiction_upper in high_risk_jurisdictions:
-        return {
-            "check": "Jurisdiction Eligibility",
-            "status": "FAIL",
-            "reason": f"Jurisdiction '{jurisdiction}' is on high-risk/sanctions list",
-            "jurisdiction": jurisdiction
-        }
+    if jurisdiction_upper in _HIGH_RISK_JURISDICTIONS:
+        return _check_result(
+            "Jurisdiction Eligibility",
+            "FAIL",
+            f"Jurisdiction '{jurisdiction}' is on high-risk/sanctions list",
+            jurisdiction=jurisdiction
+        )
     
-    if jurisdiction_upper in acceptable_jurisdictions:
-        return {
-            "check": "Jurisdiction Eligibility",
-            "status": "PASS", 
-            "reason": f"Jurisdiction '{jurisdiction}' is acceptable",
-            "jurisdiction": jurisdiction
-        }
+    if jurisdiction_upper in _ACCEPTABLE_JURISDICTIONS:
+        return _check_result(
+            "Jurisdiction Eligibility",
+            "PASS",
+            f"Jurisdiction '{jurisdiction}' is acceptable",
+            jurisdiction=jurisdiction
+        )
     
-    return {
-        "check": "Jurisdiction Eligibility",
-        "status": "PASS",
-        "reason": f"Jurisdiction '{jurisdiction}' requires additional due diligence",
-        "jurisdiction": jurisdiction,
-        "manual_review_required": True
-    }
+    return _check_result(
+        "Jurisdiction Eligibility",
+        "PASS",
+        f"Jurisdiction '{jurisdiction}' requires additional due diligence",
+        jurisdiction=jurisdiction,
+        manual_review_required=True
+    )
 
 
-def check_minimum_revenue(annual_revenue: float) -> Dict[str, Any]:
+def check_minimum_revenue(annual_revenue: float) -> CheckResult:
     """Check if company meets minimum revenue requirements"""
     
-    if annual_revenue < BANK_POLICIES.min_annual_revenue:
-        return {
-            "check": "Minimum Revenue Requirement",
-            "status": "FAIL",
-            "reason": f"Annual revenue ${annual_revenue:,.2f} is below minimum ${BANK_POLICIES.min_annual_revenue:,.2f}",
-            "annual_revenue": annual_revenue,
-            "minimum_required": BANK_POLICIES.min_annual_revenue
-        }
+    min_revenue = BANK_POLICIES.min_annual_revenue
     
-    return {
-        "check": "Minimum Revenue Requirement", 
-        "status": "PASS",
-        "reason": f"Annual revenue ${annual_revenue:,.2f} meets minimum requirement",
-        "annual_revenue": annual_revenue,
-        "minimum_required": BANK_POLICIES.min_annual_revenue
-    }
+    if annual_revenue < min_revenue:
+        return _check_result(
+            "Minimum Revenue Requirement",
+            "FAIL",
+            f"Annual revenue ${annual_revenue:,.2f} is below minimum ${min_revenue:,.2f}",
+            annual_revenue=annual_revenue,
+            minimum_required=min_revenue
+        )
+    
+    return _check_result(
+        "Minimum Revenue Requirement",
+        "PASS",
+        f"Annual revenue ${annual_revenue:,.2f} meets minimum requirement",
+        annual_revenue=annual_revenue,
+        minimum_required=min_revenue
+    )
 
 
-def check_debt_to_asset_ratio(total_liabilities: float, total_assets: float) -> Dict[str, Any]:
+def check_debt_to_asset_ratio(total_liabilities: float, total_assets: float) -> CheckResult:
     """Check debt-to-asset ratio"""
     
     if total_assets <= 0:
-        return {
-            "check": "Debt-to-Asset Ratio",
-            "status": "FAIL",
-            "reason": "Total assets must be greater than zero",
-            "total_assets": total_assets,
-            "total_liabilities": total_liabilities
-        }
+        return _check_result(
+            "Debt-to-Asset Ratio",
+            "FAIL",
+            "Total assets must be greater than zero",
+            total_assets=total_assets,
+            total_liabilities=total_liabilities
+        )
     
     debt_to_asset_ratio = total_liabilities / total_assets
     max_acceptable_ratio = 0.8  # 80% maximum debt-to-asset ratio
     
     if debt_to_asset_ratio > max_acceptable_ratio:
-        return {
-            "check": "Debt-to-Asset Ratio",
-            "status": "FAIL", 
-            "reason": f"Debt-to-asset ratio {debt_to_asset_ratio:.2%} exceeds maximum {max_acceptable_ratio:.2%}",
-            "debt_to_asset_ratio": debt_to_asset_ratio,
-            "max_acceptable_ratio": max_acceptable_ratio,
-            "total_assets": total_assets,
-            "total_liabilities": total_liabilities
-        }
+        return _check_result(
+            "Debt-to-Asset Ratio",
+            "FAIL",
+            f"Debt-to-asset ratio {debt_to_asset_ratio:.2%} exceeds maximum {max_acceptable_ratio:.2%}",
+            debt_to_asset_ratio=debt_to_asset_ratio,
+            max_acceptable_ratio=max_acceptable_ratio,
+            total_assets=total_assets,
+            total_liabilities=total_liabilities
+        )
     
-    return {
-        "check": "Debt-to-Asset Ratio",
-        "status": "PASS",
-        "reason": f"Debt-to-asset ratio {debt_to_asset_ratio:.2%} is acceptable",
-        "debt_to_asset_ratio": debt_to_asset_ratio,
-        "max_acceptable_ratio": max_acceptable_ratio,
-        "total_assets": total_assets,
-        "total_liabilities": total_liabilities
-    }
+    return _check_result(
+        "Debt-to-Asset Ratio",
+        "PASS",
+        f"Debt-to-asset ratio {debt_to_asset_ratio:.2%} is acceptable",
+        debt_to_asset_ratio=debt_to_asset_ratio,
+        max_acceptable_ratio=max_acceptable_ratio,
+        total_assets=total_assets,
+        total_liabilities=total_liabilities
+    )
 
 
 def check_basic_financial_health(annual_revenue: float, net_income: float, 
-                               total_assets: float, total_liabilities: float) -> Dict[str, Any]:
+                               total_assets: float, total_liabilities: float) -> CheckResult:
     """Perform basic financial health checks"""
     
     issues = []
@@ -383,27 +513,139 @@ def check_basic_financial_health(annual_revenue: float, net_income: float,
         issues.append("Company has negative equity (insolvent)")
     
     if issues:
-        return {
-            "check": "Basic Financial Health",
-            "status": "FAIL",
-            "reason": "Multiple financial health concerns identified",
-            "issues": issues,
-            "annual_revenue": annual_revenue,
-            "net_income": net_income,
-            "total_assets": total_assets,
-            "total_liabilities": total_liabilities,
-            "equity": equity if 'equity' in locals() else None
-        }
+        return _check_result(
+            "Basic Financial Health",
+            "FAIL",
+            "Multiple financial health concerns identified",
+            issues=tuple(issues),
+            annual_revenue=annual_revenue,
+            net_income=net_income,
+            total_assets=total_assets,
+            total_liabilities=total_liabilities,
+            equity=equity if 'equity' in locals() else None
+        )
+    
+    return _check_result(
+        "Basic Financial Health",
+        "PASS",
+        "Basic financial health metrics are acceptable",
+        annual_revenue=annual_revenue,
+        net_income=net_income,
+        total_assets=total_assets,
+        total_liabilities=total_liabilities,
+        equity=total_assets - total_liabilities
+    )
+
+
+# Initial risk checks in evaluation order, each with the assessment inputs it depends on;
+# typed caches, so 1000000 and 1000000.0 are kept apart and the reported extras always echo
+# the caller's own values rather than those of whichever call filled the cache first
+_RISK_CHECKS = tuple(
+    (lru_cache(maxsize=256, typed=True)(check), input_names) for check, input_names in (
+        # 1. INDUSTRY ELIGIBILITY CHECK
+        (check_industry_eligibility, ("industry_code",)),
+        # 2. LOAN AMOUNT LIMITS CHECK
+        (check_loan_amount_limits, ("amount_value",)),
+        # 3. GEOGRAPHIC/JURISDICTION CHECK
+        (check_jurisdiction_eligibility, ("jurisdiction",)),
+        # 4. MINIMUM REVENUE CHECK
+        (check_minimum_revenue, ("financials_annual_revenue",)),
+        # 5. DEBT-TO-ASSET RATIO CHECK
+        (check_debt_to_asset_ratio, ("financials_liabilities_total", "financials_assets_total")),
+        # 6. BASIC FINANCIAL HEALTH CHECKS
+        (check_basic_financial_health, (
+            "financials_annual_revenue",
+            "financials_net_income",
+            "financials_assets_total",
+            "financials_liabilities_total"
+        )),
+    )
+)
+
+# Boolean failure columns produced by perform_initial_risk_assessment_batch, in check order
+_BATCH_FAIL_COLUMNS = (
+    "industry_fail",
+    "amount_fail",
+    "jurisdiction_fail",
+    "revenue_fail",
+    "debt_ratio_fail",
+    "financial_health_fail"
+)
+
+
+def perform_initial_risk_assessment_batch(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Vectorized initial risk assessment for many applications at once (e.g. portfolio backfills).
+    
+    Applies the same six checks as perform_initial_risk_assessment using column operations
+    instead of a per-row Python loop.
+    
+    Args:
+        df: One application per row, with columns named after the perform_initial_risk_assessment
+            arguments (amount_value, jurisdiction, industry_code, financials_annual_revenue,
+            financials_net_income, financials_assets_total, financials_liabilities_total)
+    
+    Returns:
+        Copy of df with a boolean column per failed check, manual_review_required,
+        passed_checks and overall_status (PASS/FAIL)
+    """
+    if pd is None:
+        raise ImportError("perform_initial_risk_assessment_batch requires numpy and pandas")
+    
+    result = df.copy()
+    industry_code = df["industry_code"].astype(str)
+    jurisdiction_upper = df["jurisdiction"].astype(str).str.upper()
+    amount = df["amount_value"].astype(float)
+    revenue = df["financials_annual_revenue"].astype(float)
+    net_income = df["financials_net_income"].astype(float)
+    assets = df["financials_assets_total"].astype(float)
+    liabilities = df["financials_liabilities_total"].astype(float)
+    positive_assets = assets.where(assets > 0, np.nan)
+    
+    # 1. INDUSTRY ELIGIBILITY CHECK
+    mapped_industry = industry_code.str[:3].map(_INDUSTRY_MAPPING).fillna("unknown")
+    result["industry_fail"] = mapped_industry.isin(_PROHIBITED_INDUSTRIES)
+    
+    # 2. LOAN AMOUNT LIMITS CHECK
+    result["amount_fail"] = (
+        (amount < BANK_POLICIES.min_credit_limit) | (amount > BANK_POLICIES.max_credit_limit_absolute)
+    )
+    
+    # 3. GEOGRAPHIC/JURISDICTION CHECK
+    result["jurisdiction_fail"] = jurisdiction_upper.isin(_HIGH_RISK_JURISDICTIONS)
+    
+    # 4. MINIMUM REVENUE CHECK
+    result["revenue_fail"] = revenue < BANK_POLICIES.min_annual_revenue
+    
+    # 5. DEBT-TO-ASSET RATIO CHECK (non-positive assets compare as NaN and fail)
+    result["debt_ratio_fail"] = ~(liabilities / positive_assets <= 0.8)
+    
+    # 6. BASIC FINANCIAL HEALTH CHECKS
+    result["financial_health_fail"] = (
+        (net_income <= 0)
+        | (revenue <= 0)
+        | (revenue / positive_assets < 0.5)
+        | (assets - liabilities <= 0)
+    )
     
+    fail_flags = result[list(_BATCH_FAIL_COLUMNS)]
+    failed = fail_flags.any(axis=1)
+    result["manual_review_required"] = (
+        (~result["industry_fail"] & ~mapped_industry.isin(list(BANK_POLICIES.industry_risk_levels)))
+        | (~result["jurisdiction_fail"] & ~jurisdiction_upper.isin(_ACCEPTABLE_JURISDICTIONS))
+    )
+    result["passed_checks"] = len(_BATCH_FAIL_COLUMNS) - fail_flags.sum(axis=1)
+    result["overall_status"] = np.where(failed, "FAIL", "PASS")
+    return result
+
+
+def _error_result(stage: str, error: Exception, intent_id: str, sender_name: str) -> Dict[str, Any]:
+    """ERROR payload returned by the calculator tools when a stage raises"""
     return {
-        "check": "Basic Financial Health",
-        "status": "PASS", 
-        "reason": "Basic financial health metrics are acceptable",
-        "annual_revenue": annual_revenue,
-        "net_income": net_income,
-        "total_assets": total_assets,
-        "total_liabilities": total_liabilities,
-        "equity": total_assets - total_liabilities
+        "status": "ERROR",
+        "error": f"{stage} failed: {error}",
+        "intent_id": intent_id,
+        "sender_name": sender_name
     }
 
 
@@ -430,28 +672,93 @@ def calculate_interest_rate_and_offer(
         Dictionary with final interest rate, risk breakdown, and loan offer details
     """
     
+    return _calculate_interest_rate_and_offer(
+        intent_id,
+        sender_name,
+        amount_value,
+        repayment_duration,
+        industry_code,
+        financials_annual_revenue,
+        financials_net_income,
+        financials_assets_total,
+        financials_liabilities_total,
+        esg_certifications,
+        collateral_description,
+        esg_reporting_url,
+        carbon_emissions
+    )
+
+
+def _calculate_interest_rate_and_offer_with_fetch(
+    intent_id: str,
+    sender_name: str,
+    amount_value: float,
+    repayment_duration: int,
+    industry_code: str,
+    financials_annual_revenue: float,
+    financials_net_income: float,
+    financials_assets_total: float,
+    financials_liabilities_total: float,
+    esg_certifications: str,
+    collateral_description: str,
+    esg_reporting_url: str
+) -> Dict[str, Any]:
+    """
+    calculate_interest_rate_and_offer with the carbon emissions read from esg_reporting_url.
+    
+    The report downloads in the background while the financial risk is scored. Not an
+    agent tool: the URL comes from the applicant's payload, so only call this for URLs
+    the bank has already vetted.
+    """
+    
+    # Step 1: Fetch carbon emissions from ESG report URL (in the background)
+    emissions_future = _ESG_FETCH_EXECUTOR.submit(fetch_carbon_emissions_from_esg_report, esg_reporting_url)
+    return _calculate_interest_rate_and_offer(
+        intent_id,
+        sender_name,
+        amount_value,
+        repayment_duration,
+        industry_code,
+        financials_annual_revenue,
+        financials_net_income,
+        financials_assets_total,
+        financials_liabilities_total,
+        esg_certifications,
+        collateral_description,
+        esg_reporting_url,
+        emissions_future
+    )
+
+
+def _calculate_interest_rate_and_offer(
+    intent_id: str,
+    sender_name: str,
+    amount_value: float,
+    repayment_duration: int,
+    industry_code: str,
+    financials_annual_revenue: float,
+    financials_net_income: float,
+    financials_assets_total: float,
+    financials_liabilities_total: float,
+    esg_certifications: str,
+    collateral_description: str,
+    esg_reporting_url: str,
+    carbon_emissions: Union[float, Future]
+) -> Dict[str, Any]:
+    """Steps 2-8 of calculate_interest_rate_and_offer; a pending carbon_emissions fetch is awaited at step 6"""
+    
     try:
-        # Step 1: Fetch carbon emissions from ESG report URL
-        carbon_emissions = carbon_emissions
-        
-        # Step 2: Calculate key financial metrics
-        metrics = calculate_financial_metrics(
+        # Steps 2-5: Financial metrics, scores, weighted score and risk premium
+        metrics, scores, weighted_score, risk_premium = _score_financial_risk(
             financials_annual_revenue,
             financials_net_income,
             financials_assets_total,
             financials_liabilities_total
         )
         
-        # Step 3: Score each metric (1-5 scale)
-        scores = calculate_risk_scores(metrics)
-        
-        # Step 4: Calculate weighted risk score
-        weighted_score = calculate_weighted_risk_score(scores)
-        
-        # Step 5: Determine risk premium based on score
-        risk_premium = get_risk_premium_from_score(weighted_score)
-        
         # Step 6: Calculate ESG discount using carbon-adjusted model
+        if isinstance(carbon_emissions, Future):
+            carbon_emissions = carbon_emissions.result()
         esg_discount, esg_details = calculate_comprehensive_esg_discount(
             industry_code=industry_code,
             annual_revenue=financials_annual_revenue,
@@ -483,12 +790,34 @@ def calculate_interest_rate_and_offer(
         return loan_offer
         
     except Exception as e:
-        return {
-            "status": "ERROR",
-            "error": f"Interest rate calculation failed: {str(e)}",
-            "intent_id": intent_id,
-            "sender_name": sender_name
-        }
+        return _error_result("Interest rate calculation", e, intent_id, sender_name)
+
+
+def _score_financial_risk(annual_revenue: float, net_income: float,
+                          total_assets: float, total_liabilities: float) -> tuple:
+    """Steps 2-5 of the offer calculation: (metrics, scores, weighted_score, risk_premium)"""
+    
+    # Steps 2-4: Financial metrics, 1-5 metric scores and weighted score in one fused kernel
+    (profitability_margin, leverage_ratio,
+     profitability_score, leverage_score, scale_score,
+     unrounded_weighted_score) = _score_kernel(annual_revenue, net_income, total_assets, total_liabilities)
+    
+    metrics = {
+        "profitability_margin": profitability_margin,
+        "leverage_ratio": leverage_ratio,
+        "company_scale": annual_revenue
+    }
+    scores = {
+        "profitability_score": profitability_score,
+        "leverage_score": leverage_score,
+        "scale_score": scale_score
+    }
+    weighted_score = round(unrounded_weighted_score, 2)
+    
+    # Step 5: Determine risk premium based on score
+    risk_premium = get_risk_premium_from_score(weighted_score)
+    
+    return metrics, scores, weighted_score, risk_premium
 
 
 def calculate_financial_metrics(annual_revenue: float, net_income: float, 
@@ -511,73 +840,49 @@ def calculate_financial_metrics(annual_revenue: float, net_income: float,
     }
 
 
+# Metric scoring bands (1-5 scale, 5 = lowest risk). Each scores list has one more
+# entry than its thresholds; profitability and scale must strictly exceed a threshold
+# to reach the next band (bisect_left), leverage must stay strictly below it (bisect_right).
+_PROFIT_THR = (0.0, 0.02, 0.05, 0.10, 0.15, 0.20)
+_PROFIT_SCORES = (1.0, 1.5, 2.0, 3.0, 3.5, 4.0, 5.0)  # Loss, 0-2%, 2-5%, 5-10%, 10-15%, 15-20%, > 20%
+
+_LEV_THR = (0.2, 0.4, 0.6, 0.8)
+_LEV_SCORES = (5.0, 4.0, 3.0, 2.0, 1.0)  # < 20%, 20-40%, 40-60%, 60-80%, > 80% debt
+
+_SCALE_THR = (1_000_000, 2_000_000, 5_000_000, 10_000_000, 25_000_000, 50_000_000)
+_SCALE_SCORES = (1.0, 1.5, 2.0, 3.0, 3.5, 4.0, 5.0)  # < $1M, $1-2M, $2-5M, $5-10M, $10-25M, $25-50M, > $50M
+
+
 def calculate_risk_scores(metrics: Dict[str, float]) -> Dict[str, float]:
     """Score each financial metric on 1-5 scale (5 = lowest risk)"""
     
     scores = {}
     
     # Profitability Margin Scoring
-    profitability = metrics["profitability_margin"]
-    if profitability > 0.20:  # > 20%
-        scores["profitability_score"] = 5.0
-    elif profitability > 0.15:  # 15-20%
-        scores["profitability_score"] = 4.0
-    elif profitability > 0.10:  # 10-15%
-        scores["profitability_score"] = 3.5
-    elif profitability > 0.05:  # 5-10%
-        scores["profitability_score"] = 3.0
-    elif profitability > 0.02:  # 2-5%
-        scores["profitability_score"] = 2.0
-    elif profitability > 0:     # 0-2%
-        scores["profitability_score"] = 1.5
-    else:  # Negative (loss)
-        scores["profitability_score"] = 1.0
+    scores["profitability_score"] = _PROFIT_SCORES[bisect_left(_PROFIT_THR, metrics["profitability_margin"])]
     
     # Leverage Ratio Scoring (lower leverage = lower risk)
-    leverage = metrics["leverage_ratio"]
-    if leverage < 0.2:      # < 20% debt
-        scores["leverage_score"] = 5.0
-    elif leverage < 0.4:    # 20-40% debt
-        scores["leverage_score"] = 4.0
-    elif leverage < 0.6:    # 40-60% debt
-        scores["leverage_score"] = 3.0
-    elif leverage < 0.8:    # 60-80% debt
-        scores["leverage_score"] = 2.0
-    else:                   # > 80% debt
-        scores["leverage_score"] = 1.0
+    scores["leverage_score"] = _LEV_SCORES[bisect_right(_LEV_THR, metrics["leverage_ratio"])]
     
     # Company Scale Scoring
-    scale = metrics["company_scale"]
-    if scale > 50_000_000:      # > $50M
-        scores["scale_score"] = 5.0
-    elif scale > 25_000_000:    # $25-50M
-        scores["scale_score"] = 4.0
-    elif scale > 10_000_000:    # $10-25M
-        scores["scale_score"] = 3.5
-    elif scale > 5_000_000:     # $5-10M
-        scores["scale_score"] = 3.0
-    elif scale > 2_000_000:     # $2-5M
-        scores["scale_score"] = 2.0
-    elif scale > 1_000_000:     # $1-2M
-        scores["scale_score"] = 1.5
-    else:                       # < $1M
-        scores["scale_score"] = 1.0
+    scores["scale_score"] = _SCALE_SCORES[bisect_left(_SCALE_THR, metrics["company_scale"])]
     
     return scores
 
 
+# Risk score weights (must sum to 100%)
+_PROFITABILITY_WEIGHT = 0.40  # 40%
+_LEVERAGE_WEIGHT = 0.40       # 40%
+_SCALE_WEIGHT = 0.20          # 20%
+
+
 def calculate_weighted_risk_score(scores: Dict[str, float]) -> float:
     """Calculate weighted risk score using defined weights"""
     
-    # Weights (must sum to 100%)
-    profitability_weight = 0.40  # 40%
-    leverage_weight = 0.40       # 40%
-    scale_weight = 0.20          # 20%
-    
     weighted_score = (
-        scores["profitability_score"] * profitability_weight +
-        scores["leverage_score"] * leverage_weight +
-        scores["scale_score"] * scale_weight
+        scores["profitability_score"] * _PROFITABILITY_WEIGHT +
+        scores["leverage_score"] * _LEVERAGE_WEIGHT +
+        scores["scale_score"] * _SCALE_WEIGHT
     )
     
     return round(weighted_score, 2)
@@ -585,17 +890,51 @@ def calculate_weighted_risk_score(scores: Dict[str, float]) -> float:
 
 def get_risk_premium_from_score(weighted_score: float) -> float:
     """Map weighted risk score to interest rate premium"""
+    return _RISK_PREMIUMS[_band(_RISK_EDGES, weighted_score)]
+
+
+def _score_kernel(annual_revenue: float, net_income: float,
+                  total_assets: float, total_liabilities: float) -> tuple:
+    """
+    Fused calculate_financial_metrics -> calculate_risk_scores -> calculate_weighted_risk_score
+    on plain floats (no intermediate dicts), JIT-compiled when numba is installed.
     
-    if weighted_score >= 4.5:      # Excellent (4.5-5.0)
-        return 0.50
-    elif weighted_score >= 3.5:    # Good (3.5-4.49)
-        return 1.25
-    elif weighted_score >= 2.5:    # Average (2.5-3.49)
-        return 2.75
-    elif weighted_score >= 1.5:    # Sub-par (1.5-2.49)
-        return 4.50
-    else:                          # High-Risk (< 1.5)
-        return 6.00  # Should typically be rejected, but allowing with high premium
+    Returns:
+        (profitability_margin, leverage_ratio, profitability_score, leverage_score,
+         scale_score, unrounded weighted score)
+    """
+    
+    profitability_margin = (net_income / annual_revenue) if annual_revenue > 0 else -1.0
+    leverage_ratio = (total_liabilities / total_assets) if total_assets > 0 else 1.0
+    
+    # Band counting mirrors the bisect lookups in calculate_risk_scores (NaN lands in the worst band)
+    profit_band = 0
+    for threshold in _PROFIT_THR:
+        if profitability_margin > threshold:
+            profit_band += 1
+    leverage_band = 0
+    for threshold in _LEV_THR:
+        if not leverage_ratio < threshold:
+            leverage_band += 1
+    scale_band = 0
+    for threshold in _SCALE_THR:
+        if annual_revenue > threshold:
+            scale_band += 1
+    
+    profitability_score = _PROFIT_SCORES[profit_band]
+    leverage_score = _LEV_SCORES[leverage_band]
+    scale_score = _SCALE_SCORES[scale_band]
+    weighted_score = (
+        profitability_score * _PROFITABILITY_WEIGHT +
+        leverage_score * _LEVERAGE_WEIGHT +
+        scale_score * _SCALE_WEIGHT
+    )
+    
+    return profitability_margin, leverage_ratio, profitability_score, leverage_score, scale_score, weighted_score
+
+
+if numba is not None:
+    _score_kernel = numba.njit(cache=True)(_score_kernel)
 
 
 def calculate_comprehensive_esg_discount(
@@ -661,6 +1000,17 @@ def calculate_comprehensive_esg_discount(
     return discount, esg_details
 
 
+# Carbon performance bands: performance vs benchmark (%) must strictly exceed a threshold
+_CARBON_PERFORMANCE_THR = (-20, 0, 25, 50)
+_CARBON_SCORE_BANDS = (
+    (30, "> 20% Worse than Industry"),
+    (50, "0-20% Worse than Industry"),
+    (70, "0-25% Better than Industry"),
+    (85, "25-50% Better than Industry"),
+    (100, "> 50% Better than Industry")
+)
+
+
 def calculate_carbon_performance_score(
     industry_code: str, 
     annual_revenue: float, 
@@ -668,58 +1018,21 @@ def calculate_carbon_performance_score(
 ) -> tuple[int, Dict[str, Any]]:
     """Calculate carbon performance score based on industry benchmarks"""
     
-    # Industry benchmarks for carbon intensity (tons CO2e per $M revenue)
-    industry_benchmarks = {
-        "541": 10,    # Software Development
-        "518": 10,    # Technology/Software  
-        "311": 250,   # Food Manufacturing
-        "336": 180,   # Manufacturing (Auto)
-        "441": 80,    # Auto Dealerships
-        "221": 400,   # Utilities
-        "211": 600,   # Oil & Gas
-        "212": 500,   # Mining
-        "236": 120,   # Construction
-        "484": 150,   # Transportation
-        "621": 25,    # Healthcare Services
-        "721": 60,    # Hospitality
-        "423": 40,    # Wholesale Trade
-        "531": 30,    # Real Estate
-        "713": 50,    # Entertainment/Gambling
-        "111": 200    # Agriculture
-    }
-    
     # Get first 3 digits of NAICS code for industry classification
-    industry_key = industry_code[:3] if len(industry_code) >= 3 else industry_code
-    benchmark = industry_benchmarks.get(industry_key, 100)  # Default benchmark
+    benchmark = _INDUSTRY_BENCHMARKS.get(_industry_prefix(industry_code), 100)  # Default benchmark
     
-    # Calculate emissions intensity (tons CO2e per $M revenue)
-    if annual_revenue > 0:
+    # Calculate emissions intensity (tons CO2e per $M revenue) and performance vs benchmark
+    if annual_revenue > 0 and benchmark != 0:
         emissions_intensity = carbon_emissions / (annual_revenue / 1_000_000)
+        performance_vs_benchmark = ((benchmark - emissions_intensity) / benchmark) * 100
     else:
-        emissions_intensity = float('inf')
-        
-    # Calculate performance vs benchmark
-    if emissions_intensity == float('inf') or benchmark == 0:
+        emissions_intensity = carbon_emissions / (annual_revenue / 1_000_000) if annual_revenue > 0 else math.inf
         performance_vs_benchmark = -100  # Worst case
-    else:
-        performance_vs_benchmark = ((benchmark - emissions_intensity) / benchmark) * 100
     
     # Score based on performance vs benchmark
-    if performance_vs_benchmark > 50:      # > 50% Better
-        carbon_score = 100
-        performance_category = "> 50% Better than Industry"
-    elif performance_vs_benchmark > 25:    # 25-50% Better
-        carbon_score = 85
-        performance_category = "25-50% Better than Industry"
-    elif performance_vs_benchmark > 0:     # 0-25% Better
-        carbon_score = 70
-        performance_category = "0-25% Better than Industry"
-    elif performance_vs_benchmark > -20:   # 0-20% Worse
-        carbon_score = 50
-        performance_category = "0-20% Worse than Industry"
-    else:                                  # > 20% Worse
-        carbon_score = 30
-        performance_category = "> 20% Worse than Industry"
+    carbon_score, performance_category = _CARBON_SCORE_BANDS[
+        bisect_left(_CARBON_PERFORMANCE_THR, performance_vs_benchmark)
+    ]
     
     carbon_details = {
         "emissions_intensity": round(emissions_intensity, 1),
@@ -733,46 +1046,131 @@ def calculate_carbon_performance_score(
     return carbon_score, carbon_details
 
 
+# Points awarded for recognized certifications, one entry per certification; spacing,
+# hyphen and underscore variants (e.g. "B-CORP", "ISO14001") are matched via normalization
+_CERTIFICATION_POINTS: Mapping[str, int] = MappingProxyType({
+    "B CORP": 40,           # B Corporation certification
+    "ISO 14001": 25,        # Environmental management
+    "SBTI": 25,             # Science Based Targets initiative
+    "SCIENCE BASED TARGETS": 25,  # Alternative format
+    "SA 8000": 10,          # Social accountability
+    "LEED": 15,             # Green building
+    "ENERGY STAR": 10,      # Energy efficiency
+    "FAIR TRADE": 15,       # Fair trade practices
+    "CARBON NEUTRAL": 20,   # Carbon neutrality
+    "ISO 26000": 15,        # Social responsibility
+    "GRI": 10,              # Global reporting initiative
+    "CDP": 10,              # Carbon disclosure project
+    "TCFD": 15,             # Task Force on Climate-related Financial Disclosures
+    "UN GLOBAL COMPACT": 20 # UN Global Compact
+})
+
+# Names that refer to the same certification; each certification is credited once per entry
+_CERTIFICATION_ALIASES: Mapping[str, str] = MappingProxyType({
+    "SCIENCE BASED TARGETS": "SBTI"
+})
+
+_CERT_STRIP_SEPARATORS = str.maketrans("", "", " -_")
+_CERT_SEPARATORS_TO_SPACE = str.maketrans("-_", "  ")
+
+# Certification points keyed by name with separators removed ("BCORP", "ISO14001", ...)
+_NORMALIZED_CERTIFICATION_POINTS: Mapping[str, int] = MappingProxyType({
+    cert.translate(_CERT_STRIP_SEPARATORS): points for cert, points in _CERTIFICATION_POINTS.items()
+})
+
+
+# (variant, canonical, name, points) for every spelling: spaced and unspaced forms, since
+# hyphens/underscores in the input are turned into spaces
+_CERTIFICATION_VARIANTS = tuple(
+    (variant, _CERTIFICATION_ALIASES.get(cert, cert), cert, points)
+    for cert, points in _CERTIFICATION_POINTS.items()
+    for variant in dict.fromkeys((cert, cert.replace(" ", "")))
+)
+
+
+def _build_certification_automaton():
+    """Build a multi-pattern matcher over all certification names, if pyahocorasick is installed."""
+    
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for payload in _CERTIFICATION_VARIANTS:
+        automaton.add_word(payload[0], payload)
+    automaton.make_automaton()
+    return automaton
+
+
+_CERTIFICATION_AUTOMATON = _build_certification_automaton()
+
+
+def _find_certification_variants(text: str):
+    """(end index, variant payload) for every certification spelling in text, ordered like pyahocorasick's iter()"""
+    
+    if _CERTIFICATION_AUTOMATON is not None:
+        return _CERTIFICATION_AUTOMATON.iter(text)
+    
+    found = []
+    for payload in _CERTIFICATION_VARIANTS:
+        variant = payload[0]
+        start = text.find(variant)
+        while start >= 0:
+            found.append((start + len(variant) - 1, payload))
+            start = text.find(variant, start + 1)
+    # By end position, longest spelling first at the same end, as the automaton reports them
+    found.sort(key=lambda match: (match[0], -len(match[1][0])))
+    return found
+
+
+def _match_certifications(cert: str) -> List[tuple]:
+    """
+    Find recognized certifications in one normalized (uppercased, stripped) certification entry.
+    
+    An entry naming a single certification matches regardless of spaces, hyphens or underscores.
+    Every certification name appearing as a whole word in a longer entry is also found in a
+    single pass (e.g. "LEED GOLD" or "ISO 14001:2015"); a certification named more than once
+    in the entry, under any alias, is only credited once.
+    """
+    
+    points = _NORMALIZED_CERTIFICATION_POINTS.get(cert.translate(_CERT_STRIP_SEPARATORS))
+    if points is not None:
+        return [(cert, points)]
+    
+    text = cert.translate(_CERT_SEPARATORS_TO_SPACE)
+    # Keyed by canonical certification so "ISO 14001 / ISO14001" or "SCIENCE BASED TARGETS (SBTI)"
+    # count once; the first name found is the one reported
+    matches = {}
+    for end, (variant, canonical, name, points) in _find_certification_variants(text):
+        start = end - len(variant) + 1
+        # Only accept whole-word matches so "GRI" does not match inside "AGRICULTURE"
+        if (start == 0 or not text[start - 1].isalnum()) and (end + 1 == len(text) or not text[end + 1].isalnum()):
+            matches.setdefault(canonical, (name, points))
+    return list(matches.values())
+
+
 def calculate_qualitative_esg_score(esg_certifications: str) -> tuple[int, Dict[str, Any]]:
     """Calculate qualitative ESG score based on certifications"""
     
-    if not esg_certifications or esg_certifications.lower() in ["none", "", "null"]:
+    # Uppercase once for both the placeholder check and certification parsing
+    normalized_certifications = esg_certifications.upper() if esg_certifications else ""
+    if normalized_certifications in ("", "NONE", "NULL"):
         return 0, {"certifications": [], "total_points": 0}
     
     # Parse ESG certifications
-    certifications = [cert.strip().upper() for cert in esg_certifications.split(",")]
-    
-    # Points awarded for recognized certifications
-    certification_points = {
-        "B-CORP": 40,           # B Corporation certification
-        "B CORP": 40,           # Alternative format
-        "ISO14001": 25,         # Environmental management
-        "ISO 14001": 25,        # Alternative format
-        "SBTI": 25,             # Science Based Targets initiative
-        "SCIENCE BASED TARGETS": 25,  # Alternative format
-        "SA8000": 10,           # Social accountability
-        "SA 8000": 10,          # Alternative format
-        "LEED": 15,             # Green building
-        "ENERGY STAR": 10,      # Energy efficiency
-        "FAIR TRADE": 15,       # Fair trade practices
-        "CARBON NEUTRAL": 20,   # Carbon neutrality
-        "ISO26000": 15,         # Social responsibility
-        "ISO 26000": 15,        # Alternative format
-        "GRI": 10,              # Global reporting initiative
-        "CDP": 10,              # Carbon disclosure project
-        "TCFD": 15,             # Task Force on Climate-related Financial Disclosures
-        "UN GLOBAL COMPACT": 20 # UN Global Compact
-    }
+    certifications = [cert.strip() for cert in normalized_certifications.split(",")]
     
     total_points = 0
     recognized_certs = []
+    unrecognized_certs = []
     
     for cert in certifications:
-        if cert in certification_points:
-            points = certification_points[cert]
+        matches = _match_certifications(cert)
+        if not matches:
+            unrecognized_certs.append(cert)
+        for matched_cert, points in matches:
             total_points += points
             recognized_certs.append({
-                "certification": cert,
+                "certification": matched_cert,
                 "points": points
             })
     
@@ -783,13 +1181,122 @@ def calculate_qualitative_esg_score(esg_certifications: str) -> tuple[int, Dict[
         "certifications": recognized_certs,
         "total_points": total_points,
         "capped_score": qualitative_score,
-        "unrecognized_certs": [cert for cert in certifications 
-                              if cert not in certification_points]
+        "unrecognized_certs": unrecognized_certs
     }
     
     return qualitative_score, cert_details
 
 
+def _monthly_payment(amount_value: float, annual_rate_pct: float, term_months: int) -> float:
+    """Amortized monthly payment for an annual percentage rate"""
+    
+    monthly_rate = annual_rate_pct / 100 / 12
+    if monthly_rate > 0:
+        # float exponent keeps numba on libm pow, bit-identical to CPython's float ** int
+        growth = (1 + monthly_rate) ** float(term_months)
+        return (amount_value * monthly_rate * growth) / (growth - 1)
+    return amount_value / term_months
+
+
+if numba is not None:
+    _monthly_payment = numba.njit(cache=True)(_monthly_payment)
+    _monthly_payment(1.0, 1.0, 12)  # Compile (or load from cache) at import, not on the first offer
+
+
+def _monthly_payment_vec(amounts: "np.ndarray", annual_rates_pct: "np.ndarray", terms: "np.ndarray") -> "np.ndarray":
+    """Vectorized _monthly_payment over float64 arrays of amounts, annual rates (%) and terms"""
+    
+    monthly_rates = annual_rates_pct / 100 / 12
+    growth = np.power(1 + monthly_rates, terms)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(monthly_rates > 0, amounts * monthly_rates * growth / (growth - 1), amounts / terms)
+
+
+class LoanTerms(TypedDict):
+    """The "loan_offer" section of generate_loan_offer"""
+    principal_amount: float
+    interest_rate: float
+    term_months: int
+    monthly_payment: float
+    total_interest: float
+    total_repayment: float
+
+
+class LoanOfferJSON(TypedDict):
+    """Successful generate_loan_offer_json payload (plain dict at runtime)"""
+    offer_id: str
+    intent_id: str
+    created_at: str
+    protocol_version: str
+    bank_agent_id: str
+    status: str
+    amount_approved: int
+    currency: str
+    interest_rate_annual: float
+    repayment_duration_months: int
+    repayment_schedule: str
+    esg_impact_summary: str
+
+
+def _loan_terms(amount_value: float, interest_rate: float, term_months: int,
+                monthly_payment: float, total_interest: float) -> LoanTerms:
+    """Build the loan terms shared by single and batch offers, rounded to cents"""
+    # Money is rounded once to integer cents and summed as ints; each value is converted
+    # back to dollars only when the dict is built (the rate is rounded to hundredths the same way)
+    principal_cents = round(amount_value * 100)
+    interest_cents = round(total_interest * 100)
+    return {
+        "principal_amount": amount_value,
+        "interest_rate": round(interest_rate * 100) / 100,
+        "term_months": term_months,
+        "monthly_payment": round(monthly_payment * 100) / 100,
+        "total_interest": interest_cents / 100,
+        "total_repayment": (principal_cents + interest_cents) / 100
+    }
+
+
+def generate_loan_offers_batch(amounts, annual_rates_pct, terms) -> List[LoanTerms]:
+    """
+    Compute the "loan_offer" terms for many loans at once (batch re-scoring, stress tests).
+    
+    Args:
+        amounts: Principal amounts
+        annual_rates_pct: Final annual interest rates in percent
+        terms: Repayment durations in months
+    
+    Returns:
+        One loan terms dictionary per loan, matching generate_loan_offer's "loan_offer" section
+    """
+    if np is None:
+        raise ImportError("generate_loan_offers_batch requires numpy")
+    
+    amounts = np.asarray(amounts, dtype=np.float64)
+    annual_rates_pct = np.asarray(annual_rates_pct, dtype=np.float64)
+    terms = np.asarray(terms)
+    monthly_payments = _monthly_payment_vec(amounts, annual_rates_pct, terms)
+    total_interests = monthly_payments * terms - amounts
+    
+    return [
+        _loan_terms(amount, rate, term, payment, interest)
+        for amount, rate, term, payment, interest in zip(
+            amounts.tolist(), annual_rates_pct.tolist(), terms.tolist(),
+            monthly_payments.tolist(), total_interests.tolist()
+        )
+    ]
+
+
+# Fixed loan offer text shared by every offer
+_NEXT_STEPS = (
+    "Formal application submission required",
+    "Credit verification and documentation review",
+    "Collateral appraisal (if applicable)", 
+    "Final underwriting approval",
+    "Loan agreement execution"
+)
+_OFFER_EXPIRES = "30 days from generation"
+_OFFER_GENERATED_AT = "2024-01-15T12:00:00Z"  # Placeholder; a real timestamp would be time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
 def generate_loan_offer(intent_id: str, sender_name: str, amount_value: float,
                        repayment_duration: int, final_interest_rate: float,
                        risk_premium: float, esg_discount: float, weighted_score: float,
@@ -798,89 +1305,71 @@ def generate_loan_offer(intent_id: str, sender_name: str, amount_value: float,
     """Generate comprehensive loan offer with all details"""
     
     # Calculate monthly payment (simple interest for demonstration)
-    monthly_rate = final_interest_rate / 100 / 12
-    monthly_payment = (amount_value * monthly_rate * (1 + monthly_rate)**repayment_duration) / \
-                     ((1 + monthly_rate)**repayment_duration - 1) if monthly_rate > 0 else amount_value / repayment_duration
+    monthly_payment = _monthly_payment(amount_value, final_interest_rate, repayment_duration)
     
     total_interest = (monthly_payment * repayment_duration) - amount_value
     
-    # Determine risk category from weighted score
-    if weighted_score >= 4.5:
-        risk_category = "Excellent"
-    elif weighted_score >= 3.5:
-        risk_category = "Good"
-    elif weighted_score >= 2.5:
-        risk_category = "Average"
-    elif weighted_score >= 1.5:
-        risk_category = "Sub-par"
-    else:
-        risk_category = "High-Risk"
+    # Loan Terms
+    loan_terms = _loan_terms(amount_value, final_interest_rate, repayment_duration,
+                             monthly_payment, total_interest)
+    
+    # Interest Rate Breakdown
+    rate_calculation = {
+        "base_rate": BANK_POLICIES.base_interest_rate,
+        "risk_premium": risk_premium,
+        "esg_discount": esg_discount,
+        "final_rate": loan_terms["interest_rate"]
+    }
+    
+    # Risk Assessment Details
+    financial_metrics = {
+        "profitability_margin": f"{metrics['profitability_margin']:.2%}",
+        "leverage_ratio": f"{metrics['leverage_ratio']:.2%}",
+        "company_scale": f"${metrics['company_scale']:,.0f}"
+    }
+    metric_scores = {
+        "profitability_score": scores['profitability_score'],
+        "leverage_score": scores['leverage_score'],
+        "scale_score": scores['scale_score']
+    }
+    risk_analysis = {
+        "weighted_risk_score": weighted_score,
+        "risk_category": get_risk_category_from_score(weighted_score),
+        "financial_metrics": financial_metrics,
+        "metric_scores": metric_scores
+    }
+    
+    # ESG Analysis (if available)
+    if not esg_details:
+        esg_details = {
+            "final_esg_score": "Not calculated",
+            "esg_category": "Not assessed",
+            "discount_percentage": esg_discount
+        }
+    
+    # Additional Terms
+    terms_and_conditions = {
+        "collateral_required": collateral_description if collateral_description else "To be determined",
+        "origination_fee": round(amount_value * 0.01, 2),  # 1% origination fee
+        "prepayment_penalty": "None for payments > 20% of principal",
+        "draw_period": "24 months" if repayment_duration > 24 else f"{repayment_duration} months"
+    }
     
     return {
         "status": "APPROVED",
         "intent_id": intent_id,
         "sender_name": sender_name,
-        
-        # Loan Terms
-        "loan_offer": {
-            "principal_amount": amount_value,
-            "interest_rate": round(final_interest_rate, 2),
-            "term_months": repayment_duration,
-            "monthly_payment": round(monthly_payment, 2),
-            "total_interest": round(total_interest, 2),
-            "total_repayment": round(amount_value + total_interest, 2)
-        },
-        
-        # Interest Rate Breakdown
-        "rate_calculation": {
-            "base_rate": BANK_POLICIES.base_interest_rate,
-            "risk_premium": risk_premium,
-            "esg_discount": esg_discount,
-            "final_rate": round(final_interest_rate, 2)
-        },
-        
-        # Risk Assessment Details
-        "risk_analysis": {
-            "weighted_risk_score": weighted_score,
-            "risk_category": risk_category,
-            "financial_metrics": {
-                "profitability_margin": f"{metrics['profitability_margin']:.2%}",
-                "leverage_ratio": f"{metrics['leverage_ratio']:.2%}",
-                "company_scale": f"${metrics['company_scale']:,.0f}"
-            },
-            "metric_scores": {
-                "profitability_score": scores['profitability_score'],
-                "leverage_score": scores['leverage_score'],
-                "scale_score": scores['scale_score']
-            }
-        },
-        
-        # ESG Analysis (if available)
-        "esg_analysis": esg_details if esg_details else {
-            "final_esg_score": "Not calculated",
-            "esg_category": "Not assessed",
-            "discount_percentage": esg_discount
-        },
-        
-        # Additional Terms
-        "terms_and_conditions": {
-            "collateral_required": collateral_description if collateral_description else "To be determined",
-            "origination_fee": round(amount_value * 0.01, 2),  # 1% origination fee
-            "prepayment_penalty": "None for payments > 20% of principal",
-            "draw_period": "24 months" if repayment_duration > 24 else f"{repayment_duration} months"
-        },
+        "loan_offer": loan_terms,
+        "rate_calculation": rate_calculation,
+        "risk_analysis": risk_analysis,
+        "esg_analysis": esg_details,
+        "terms_and_conditions": terms_and_conditions,
         
         # Next Steps
-        "next_steps": [
-            "Formal application submission required",
-            "Credit verification and documentation review",
-            "Collateral appraisal (if applicable)", 
-            "Final underwriting approval",
-            "Loan agreement execution"
-        ],
+        "next_steps": list(_NEXT_STEPS),
         
-        "offer_expires": "30 days from generation",
-        "generated_at": "2024-01-15T12:00:00Z"  # Would be actual timestamp
+        "offer_expires": _OFFER_EXPIRES,
+        "generated_at": _OFFER_GENERATED_AT
     }
 
 
@@ -908,11 +1397,14 @@ def calculate_final_approved_amount(
     """
     
     try:
-        # Step 1: Get base lending ratio from bank policies
-        base_ratio = BANK_POLICIES.base_lending_ratio  # 15%
+        # Step 1: Get base lending ratio and absolute limits from bank policies
+        bank_policies = BANK_POLICIES
+        base_ratio = bank_policies.base_lending_ratio  # 15%
+        max_credit_limit = bank_policies.max_credit_limit_absolute
+        min_credit_limit = bank_policies.min_credit_limit
         
-        # Step 2: Calculate Financial Risk Adjustment
-        financial_adjustment = get_financial_risk_adjustment(weighted_risk_score)
+        # Step 2: Calculate Financial Risk Adjustment (and the risk category for reporting)
+        risk_category, financial_adjustment, _ = _risk_row(weighted_risk_score)
         
         # Step 3: Calculate ESG Opportunity Adjustment  
         esg_adjustment = get_esg_opportunity_adjustment(final_esg_score)
@@ -924,8 +1416,8 @@ def calculate_final_approved_amount(
         max_approved_amount = annual_revenue * adjusted_ratio
         
         # Step 6: Apply absolute limits from bank policies
-        max_approved_amount = min(max_approved_amount, BANK_POLICIES.max_credit_limit_absolute)
-        max_approved_amount = max(max_approved_amount, BANK_POLICIES.min_credit_limit)
+        max_approved_amount = min(max_approved_amount, max_credit_limit)
+        max_approved_amount = max(max_approved_amount, min_credit_limit)
         
         # Step 7: Final Decision Logic - compare requested vs calculated max
         if requested_amount <= max_approved_amount:
@@ -937,8 +1429,7 @@ def calculate_final_approved_amount(
             approval_reason = f"Requested amount (${requested_amount:,.2f}) exceeds calculated maximum (${max_approved_amount:,.2f})"
             approval_status = "PARTIALLY_APPROVED"
         
-        # Determine risk and ESG categories for reporting
-        risk_category = get_risk_category_from_score(weighted_risk_score)
+        # Determine ESG category for reporting
         esg_category = get_esg_category_from_score(final_esg_score)
         
         return {
@@ -971,68 +1462,92 @@ def calculate_final_approved_amount(
         }
         
     except Exception as e:
-        return {
-            "status": "ERROR",
-            "error": f"Final approved amount calculation failed: {str(e)}",
-            "intent_id": intent_id,
-            "sender_name": sender_name
-        }
+        return _error_result("Final approved amount calculation", e, intent_id, sender_name)
+
+
+# Bands for ">= edge" ladders on the 1-5 weighted risk score and the 0-100 ESG score
+_RISK_EDGES = (1.5, 2.5, 3.5, 4.5)
+# (category, lending ratio adjustment, duration adjustment factor) per risk band
+_RISK_TABLE = (
+    ("High-Risk", -0.10, 0.25),   # -10.0% ratio, cap at 25% of policy maximum (or manual review)
+    ("Sub-par", -0.05, 0.5),      # -5.0% ratio, cap at 50% of policy maximum
+    ("Average", 0.0, 0.75),       # +0.0% ratio, cap at 75% of policy maximum
+    ("Good", 0.025, 0.9),         # +2.5% ratio, cap at 90% of policy maximum
+    ("Excellent", 0.05, 1.0)      # +5.0% ratio, no duration adjustment
+)
+# Interest rate premium per risk band (High-Risk should typically be rejected, but is allowed with a high premium)
+_RISK_PREMIUMS = (6.00, 4.50, 2.75, 1.25, 0.50)
+
+_ESG_EDGES = (50, 75, 90)
+_ESG_CATS = ("ESG Laggard", "ESG Average Performer", "ESG Strong Performer", "ESG Leader")
+_ESG_ADJ = (-0.01, 0.0, 0.015, 0.025)  # -1.0% / +0.0% / +1.5% / +2.5%
+
+
+def _band(edges: tuple, score: float) -> int:
+    """Index of the band a score falls in; NaN lands in the lowest band, as with the old comparisons"""
+    return bisect_right(edges, score) if score == score else 0
+
+
+def _risk_row(weighted_risk_score: float) -> tuple:
+    """(category, lending ratio adjustment, duration adjustment factor) for a weighted risk score"""
+    return _RISK_TABLE[_band(_RISK_EDGES, weighted_risk_score)]
 
 
 def get_financial_risk_adjustment(weighted_risk_score: float) -> float:
     """Get financial risk adjustment based on weighted risk score"""
-    
-    if weighted_risk_score >= 4.5:      # Excellent (4.5-5.0)
-        return 0.05  # +5.0%
-    elif weighted_risk_score >= 3.5:    # Good (3.5-4.49)
-        return 0.025  # +2.5%
-    elif weighted_risk_score >= 2.5:    # Average (2.5-3.49)
-        return 0.0   # +0.0%
-    elif weighted_risk_score >= 1.5:    # Sub-par (1.5-2.49)
-        return -0.05  # -5.0%
-    else:                               # High-Risk (< 1.5)
-        return -0.10  # -10.0%
+    return _risk_row(weighted_risk_score)[1]
 
 
 def get_esg_opportunity_adjustment(final_esg_score: float) -> float:
     """Get ESG opportunity adjustment based on final ESG score"""
-    
-    if final_esg_score >= 90:      # ESG Leader (90-100)
-        return 0.025  # +2.5%
-    elif final_esg_score >= 75:    # ESG Strong Performer (75-89)
-        return 0.015  # +1.5%
-    elif final_esg_score >= 50:    # ESG Average Performer (50-74)
-        return 0.0    # +0.0%
-    else:                          # ESG Laggard (< 50)
-        return -0.01  # -1.0%
+    return _ESG_ADJ[_band(_ESG_EDGES, final_esg_score)]
 
 
 def get_risk_category_from_score(weighted_risk_score: float) -> str:
     """Get risk category string from weighted risk score"""
-    
-    if weighted_risk_score >= 4.5:
-        return "Excellent"
-    elif weighted_risk_score >= 3.5:
-        return "Good"
-    elif weighted_risk_score >= 2.5:
-        return "Average"
-    elif weighted_risk_score >= 1.5:
-        return "Sub-par"
-    else:
-        return "High-Risk"
+    return _risk_row(weighted_risk_score)[0]
 
 
 def get_esg_category_from_score(final_esg_score: float) -> str:
     """Get ESG category string from final ESG score"""
+    return _ESG_CATS[_band(_ESG_EDGES, final_esg_score)]
+
+
+def _risk_band_kernel(weighted_risk_score: float) -> int:
+    """Scalar _band over _RISK_EDGES, compiled into a NumPy ufunc when numba is installed"""
+    band = 0
+    for edge in _RISK_EDGES:
+        if weighted_risk_score >= edge:
+            band += 1
+    return band
+
+
+if numba is not None:
+    _risk_band_ufunc = numba.vectorize(["int64(float64)"], cache=True)(_risk_band_kernel)
+
+_RISK_CATS_ARRAY = np.array([row[0] for row in _RISK_TABLE]) if np is not None else None
+
+
+def categorize_risk_scores(weighted_risk_scores) -> "np.ndarray":
+    """
+    Risk category for every weighted risk score in an array (batch get_risk_category_from_score).
     
-    if final_esg_score >= 90:
-        return "ESG Leader"
-    elif final_esg_score >= 75:
-        return "ESG Strong Performer"
-    elif final_esg_score >= 50:
-        return "ESG Average Performer"
+    Args:
+        weighted_risk_scores: Weighted risk scores (1-5), e.g. a DataFrame column
+    
+    Returns:
+        Array of risk category strings; NaN scores fall in the lowest band
+    """
+    if np is None:
+        raise ImportError("categorize_risk_scores requires numpy")
+    
+    scores = np.asarray(weighted_risk_scores, dtype=np.float64)
+    if numba is not None:
+        with np.errstate(invalid="ignore"):  # NaN comparisons are expected
+            bands = _risk_band_ufunc(scores)
     else:
-        return "ESG Laggard"
+        bands = (scores[..., np.newaxis] >= np.asarray(_RISK_EDGES)).sum(axis=-1)
+    return _RISK_CATS_ARRAY[bands]
 
 
 def calculate_approved_repayment_duration(
@@ -1063,21 +1578,19 @@ def calculate_approved_repayment_duration(
         normalized_purpose = normalize_loan_purpose(purpose)
         
         # Step 2: Get policy maximum duration for this purpose
-        purpose_limits = get_purpose_duration_limits(normalized_purpose)
+        purpose_limits = _PURPOSE_DURATION_LIMITS.get(normalized_purpose)
         
-        if not purpose_limits:
+        if purpose_limits is None:
             # Default limits for unknown purposes
-            purpose_limits = {"max_duration": 36, "min_duration": 12}
+            purpose_limits = _DEFAULT_DURATION_LIMITS
             purpose_status = "UNKNOWN_PURPOSE_DEFAULT_APPLIED"
         else:
             purpose_status = "PURPOSE_POLICY_APPLIED"
         
-        policy_max_duration = purpose_limits["max_duration"]
-        policy_min_duration = purpose_limits["min_duration"]
+        policy_max_duration, policy_min_duration = purpose_limits
         
         # Step 3: Calculate risk-adjusted maximum duration
-        risk_adjustment_factor = get_risk_duration_adjustment_factor(weighted_risk_score)
-        risk_category = get_risk_category_from_score(weighted_risk_score)
+        risk_category, _, risk_adjustment_factor = _risk_row(weighted_risk_score)
         
         # Apply risk adjustment to policy maximum
         risk_adjusted_max = int(policy_max_duration * risk_adjustment_factor)
@@ -1147,14 +1660,67 @@ def calculate_approved_repayment_duration(
         }
         
     except Exception as e:
-        return {
-            "status": "ERROR",
-            "error": f"Repayment duration calculation failed: {str(e)}",
-            "intent_id": intent_id,
-            "sender_name": sender_name
-        }
+        return _error_result("Repayment duration calculation", e, intent_id, sender_name)
+
+
+# Map common loan purpose variations to standard purposes
+_PURPOSE_MAP: Mapping[str, str] = MappingProxyType({
+    "working capital": "working_capital",
+    "working_capital": "working_capital",
+    "cash flow": "cash_flow_management",
+    "cash_flow_management": "cash_flow_management",
+    "inventory": "inventory_financing",
+    "inventory_financing": "inventory_financing",
+    "equipment": "equipment_purchase",
+    "equipment_purchase": "equipment_purchase",
+    "equipment financing": "equipment_purchase",
+    "expansion": "business_expansion",
+    "business_expansion": "business_expansion",
+    "business expansion": "business_expansion",
+    "seasonal": "seasonal_financing",
+    "seasonal_financing": "seasonal_financing",
+    "bridge": "bridge_financing",
+    "bridge_financing": "bridge_financing",
+    "acquisition": "acquisition_financing",
+    "acquisition_financing": "acquisition_financing",
+    "refinancing": "refinancing",
+    "refinance": "refinancing",
+    "debt consolidation": "debt_consolidation",
+    "debt_consolidation": "debt_consolidation",
+    "consolidation": "debt_consolidation",
+    "general": "general_business_purposes",
+    "general_business_purposes": "general_business_purposes",
+    "general business purposes": "general_business_purposes",
+    "business purposes": "general_business_purposes"
+})
+
+# Any known purpose occurring in a description, longest alternatives first so the most specific wins
+_PURPOSE_RE = re.compile("|".join(sorted(map(re.escape, _PURPOSE_MAP), key=len, reverse=True)))
+
+
+def _build_purpose_automaton():
+    """Build a multi-pattern matcher over all purpose keys, if pyahocorasick is installed."""
+    
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for key, standard_purpose in _PURPOSE_MAP.items():
+        automaton.add_word(key, standard_purpose)
+    automaton.make_automaton()
+    return automaton
+
+
+# Leftmost-longest matches (iter_long) pick the same key as _PURPOSE_RE in one pass over the description
+_PURPOSE_AUTOMATON = _build_purpose_automaton()
 
+# All purpose keys joined into one string so a description contained in a key is found with one str.find
+_PURPOSE_KEYS = tuple(_PURPOSE_MAP)
+_PURPOSE_KEY_BLOB = "\n".join(_PURPOSE_KEYS)
+_PURPOSE_KEY_STARTS = tuple(accumulate((len(key) + 1 for key in _PURPOSE_KEYS[:-1]), initial=0))
 
+
+@lru_cache(maxsize=256)
 def normalize_loan_purpose(purpose: str) -> str:
     """Normalize loan purpose string to match policy keys"""
     
@@ -1164,69 +1730,64 @@ def normalize_loan_purpose(purpose: str) -> str:
     # Convert to lowercase and replace common variations
     normalized = purpose.lower().strip()
     
-    # Map common variations to standard purposes
-    purpose_mappings = {
-        "working capital": "working_capital",
-        "working_capital": "working_capital",
-        "cash flow": "cash_flow_management",
-        "cash_flow_management": "cash_flow_management",
-        "inventory": "inventory_financing",
-        "inventory_financing": "inventory_financing",
-        "equipment": "equipment_purchase",
-        "equipment_purchase": "equipment_purchase",
-        "equipment financing": "equipment_purchase",
-        "expansion": "business_expansion",
-        "business_expansion": "business_expansion",
-        "business expansion": "business_expansion",
-        "seasonal": "seasonal_financing",
-        "seasonal_financing": "seasonal_financing",
-        "bridge": "bridge_financing",
-        "bridge_financing": "bridge_financing",
-        "acquisition": "acquisition_financing",
-        "acquisition_financing": "acquisition_financing",
-        "refinancing": "refinancing",
-        "refinance": "refinancing",
-        "debt consolidation": "debt_consolidation",
-        "debt_consolidation": "debt_consolidation",
-        "consolidation": "debt_consolidation",
-        "general": "general_business_purposes",
-        "general_business_purposes": "general_business_purposes",
-        "general business purposes": "general_business_purposes",
-        "business purposes": "general_business_purposes"
-    }
-    
     # Check for exact matches first
-    if normalized in purpose_mappings:
-        return purpose_mappings[normalized]
+    standard_purpose = _PURPOSE_MAP.get(normalized)
+    if standard_purpose is not None:
+        return standard_purpose
+    
+    # Check for partial matches: a known purpose inside the description (most specific first)
+    if _PURPOSE_AUTOMATON is not None:
+        for _, standard_purpose in _PURPOSE_AUTOMATON.iter_long(normalized):
+            return standard_purpose
+    else:
+        match = _PURPOSE_RE.search(normalized)
+        if match:
+            return _PURPOSE_MAP[match.group(0)]
     
-    # Check for partial matches
-    for key, value in purpose_mappings.items():
-        if key in normalized or normalized in key:
-            return value
+    # ...or a short description inside a known purpose (e.g. "equip")
+    if "\n" not in normalized:
+        position = _PURPOSE_KEY_BLOB.find(normalized)
+        if position >= 0:
+            return _PURPOSE_MAP[_PURPOSE_KEYS[bisect_right(_PURPOSE_KEY_STARTS, position) - 1]]
     
     # Default to general business purposes if no match found
     return "general_business_purposes"
 
 
+# (max_duration, min_duration) per purpose, unpacked directly by calculate_approved_repayment_duration
+_PURPOSE_DURATION_LIMITS: Mapping[str, tuple] = MappingProxyType({
+    purpose: (limits["max_duration"], limits["min_duration"])
+    for purpose, limits in BANK_POLICIES.loan_purpose_duration_limits.items()
+})
+_DEFAULT_DURATION_LIMITS = (36, 12)
+
+
 def get_purpose_duration_limits(normalized_purpose: str) -> Dict[str, int]:
     """Get duration limits for a specific loan purpose"""
     
-    return BANK_POLICIES.loan_purpose_duration_limits.get(normalized_purpose)
+    # Copy, so callers get a plain dict rather than the shared read-only policy table
+    limits = BANK_POLICIES.get_duration_limits(normalized_purpose)
+    return dict(limits) if limits is not None else None
 
 
 def get_risk_duration_adjustment_factor(weighted_risk_score: float) -> float:
     """Get duration adjustment factor based on risk score"""
+    return _risk_row(weighted_risk_score)[2]
+
+
+def _get_result_field(result: Any, *path: str, name: str) -> Any:
+    """Walk a nested tool result, raising one ValueError that names the result and missing key
     
-    if weighted_risk_score >= 4.5:      # Excellent (4.5-5.0)
-        return 1.0   # No adjustment (100%)
-    elif weighted_risk_score >= 3.5:    # Good (3.5-4.49)
-        return 0.9   # Cap at 90% of policy maximum
-    elif weighted_risk_score >= 2.5:    # Average (2.5-3.49)
-        return 0.75  # Cap at 75% of policy maximum
-    elif weighted_risk_score >= 1.5:    # Sub-par (1.5-2.49)
-        return 0.5   # Cap at 50% of policy maximum
-    else:                               # High-Risk (< 1.5)
-        return 0.25  # Cap at 25% of policy maximum (or manual review)
+    Always pass the tool result itself with the full key path, so the error lists its top-level keys.
+    """
+    
+    value = result
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            result_keys = list(result.keys()) if isinstance(result, dict) else 'Not a dict'
+            raise ValueError(f"Missing or invalid {name} structure: {key!r}. Result keys: {result_keys}")
+        value = value[key]
+    return value
 
 
 def generate_loan_offer_json(
@@ -1252,12 +1813,9 @@ def generate_loan_offer_json(
     """
     
     try:
-        import uuid
-        from datetime import datetime
-        
         # Generate unique offer ID
-        offer_id = str(uuid.uuid4())
-        current_timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        offer_id = str(uuid4())
+        current_timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         
         # Check for errors in input tool results first
         if interest_rate_result.get('status') == 'ERROR':
@@ -1270,27 +1828,19 @@ def generate_loan_offer_json(
             raise Exception(f"Duration calculation failed: {duration_result.get('error', 'Unknown error')}")
         
         # Extract key data from tool results with error checking
-        try:
-            approved_amount = approved_amount_result['approval_decision']['final_approved_amount']
-        except (KeyError, TypeError) as e:
-            raise Exception(f"Missing or invalid approved_amount_result structure: {e}. Result keys: {list(approved_amount_result.keys()) if isinstance(approved_amount_result, dict) else 'Not a dict'}")
-            
-        try:
-            interest_rate = interest_rate_result['rate_calculation']['final_rate']
-        except (KeyError, TypeError) as e:
-            raise Exception(f"Missing or invalid interest_rate_result structure: {e}. Result keys: {list(interest_rate_result.keys()) if isinstance(interest_rate_result, dict) else 'Not a dict'}")
-            
-        try:
-            duration_months = duration_result['duration_decision']['final_approved_duration_months']
-        except (KeyError, TypeError) as e:
-            raise Exception(f"Missing or invalid duration_result structure: {e}. Result keys: {list(duration_result.keys()) if isinstance(duration_result, dict) else 'Not a dict'}")
+        approved_amount = _get_result_field(
+            approved_amount_result, "approval_decision", "final_approved_amount", name="approved_amount_result"
+        )
+        interest_rate = _get_result_field(interest_rate_result, "rate_calculation", "final_rate", name="interest_rate_result")
+        duration_months = _get_result_field(
+            duration_result, "duration_decision", "final_approved_duration_months", name="duration_result"
+        )
         
         # Determine overall approval status
-        try:
-            amount_status = approved_amount_result['approval_decision']['approval_status']
-            duration_status = duration_result['duration_decision']['approval_status']
-        except (KeyError, TypeError) as e:
-            raise Exception(f"Missing status information in results: {e}")
+        amount_status = _get_result_field(
+            approved_amount_result, "approval_decision", "approval_status", name="approved_amount_result"
+        )
+        duration_status = _get_result_field(duration_result, "duration_decision", "approval_status", name="duration_result")
         
         if amount_status == "FULLY_APPROVED" and duration_status == "FULLY_APPROVED":
             offer_status = "OFFER_EXTENDED"
@@ -1300,7 +1850,7 @@ def generate_loan_offer_json(
             offer_status = "OFFER_EXTENDED"
         
         # Build simplified loan offer JSON with only required fields plus ESG impact summary
-        loan_offer_json = {
+        loan_offer_json: LoanOfferJSON = {
             "offer_id": offer_id,
             "intent_id": intent_id,
             "created_at": current_timestamp,
@@ -1318,13 +1868,8 @@ def generate_loan_offer_json(
         return loan_offer_json
         
     except Exception as e:
-        return {
-            "status": "ERROR",
-            "error": f"Loan offer JSON generation failed: {str(e)}",
-            "intent_id": intent_id,
-            "sender_name": sender_name
-        }
+        return _error_result("Loan offer JSON generation", e, intent_id, sender_name)
 
-def negotiate_loan(negotiation_score: float, preferred_interest_rate: float, annual_interest_rate: float, negotiation_interest_rate: float):
+def negotiate_loan(negotiation_score: float, preferred_interest_rate: float, annual_interest_rate: float, negotiation_interest_rate: float) -> float:
     discount = negotiation_score*0.04
     return (max(negotiation_interest_rate, (annual_interest_rate - discount)))
\ No newline at end of file
@@ -1,7 +1,9 @@
+import asyncio
 import logging
-from starlette.responses import JSONResponse
-import json
-import uuid
+import os
+import traceback
+from starlette.responses import Response
+import orjson
 from a2a.server.agent_execution.context import RequestContext
 from a2a.server.events.event_queue import EventQueue
 from a2a.types import Part, TextPart
@@ -25,37 +27,160 @@ from google.adk.sessions import InMemorySessionService
 
 load_dotenv()
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
-def main():
-    """Starts the Tachyon-compatible agent server."""
-    host = "localhost"
-    port = 10005
+
+HOST = "localhost"
+PORT = 10005
+
+# Static agent metadata, validated once at import
+AGENT_CAPABILITIES = AgentCapabilities(streaming=True)
+AGENT_SKILL = AgentSkill(
+    id="nexvault_credit_request", 
+    name="NexVault Bank Credit Processing",
+    description="NexVault Bank's ultra-premium lending for large enterprises with exclusive ESG partnerships.",
+    tags=["banking", "credit", "esg", "finance"],
+    examples=["Process a credit request for $500,000 for 24 months"],
+)
+AGENT_CARD = AgentCard(
+    name="NexVault Bank Agent",
+    description="NexVault Bank's agent for processing credit line requests with ESG integration.",
+    url=f"http://{HOST}:{PORT}/",
+    version="1.0.0",
+    defaultInputModes=["text/plain"],
+    defaultOutputModes=["text/plain"],
+    capabilities=AGENT_CAPABILITIES,
+    skills=[AGENT_SKILL], 
+)
+AGENT_CARD_URL = "/.well-known/agent-card.json"
+# The card never changes after startup, so it is serialized once and served as raw bytes
+_AGENT_CARD_BYTES = orjson.dumps(AGENT_CARD.model_dump(mode="json", by_alias=True, exclude_none=True))
+
+# Back-pressure: agent runs allowed at once before new requests are rejected as overloaded
+MAX_CONCURRENT_EXECUTIONS = int(os.getenv("BANK_MAX_CONCURRENCY", "16"))
+_EXECUTION_GATE = asyncio.Semaphore(MAX_CONCURRENT_EXECUTIONS)
+
+
+# Success reply for send_message; the request id, taskId and contextId are spliced in already orjson-encoded
+_SEND_MESSAGE_OK = b'{"jsonrpc":"2.0","id":%b,"result":{"taskId":%b,"contextId":%b,"status":"completed"}}'
+# Error replies that never echo a request id are built once
+_PARSE_ERROR = orjson.dumps({"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}})
+_INVALID_REQUEST = orjson.dumps({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}})
+
+
+def _json_response(content, status_code: int = 200) -> Response:
+    """JSON response serialized with orjson instead of JSONResponse's stdlib json"""
+    return Response(orjson.dumps(content), status_code=status_code, media_type="application/json")
+
+
+async def _handle_agent_card(request):
+    """Serve the pre-serialized agent card"""
+    return Response(_AGENT_CARD_BYTES, media_type="application/json")
+
+
+async def _handle_send_message(data, agent_executor):
+    """Run the bank agent for a JSON-RPC send_message request"""
+    params = data.get('params', {})
+    message = params.get('message', {})
+    
+    logger.debug("📨 Processing send_message: %s", message)
+    
     try:
-        capabilities = AgentCapabilities(streaming=True)
-        skill = AgentSkill(
-            id="nexvault_credit_request", 
-            name="NexVault Bank Credit Processing",
-            description="NexVault Bank's ultra-premium lending for large enterprises with exclusive ESG partnerships.",
-            tags=["banking", "credit", "esg", "finance"],
-            examples=["Process a credit request for $500,000 for 24 months"],
+        # model_construct skips Pydantic validation; the text is copied as-is from the request
+        message_parts = [
+            Part.model_construct(root=TextPart.model_construct(text=part['text']))
+            for part in message.get('parts', ())
+            if part.get('type') == 'text'
+        ]
+    except KeyError as missing:
+        error_response = {
+            "jsonrpc": "2.0",
+            "id": data.get('id'),
+            "error": {
+                "code": -32602,
+                "message": f"Invalid params: text part is missing {missing}"
+            }
+        }
+        return _json_response(error_response)
+
+    try:
+        # Opaque random ids for callers that omit them; no UUID object is needed
+        task_id = message.get('taskId') or os.urandom(16).hex()
+        context_id = message.get('contextId') or os.urandom(16).hex()
+
+        request_context = RequestContext(
+            task_id=task_id,
+            context_id=context_id,
+            message=types.UserContent(parts=message_parts) if message_parts else None
         )
-        agent_card = AgentCard(
-            name="NexVault Bank Agent",
-            description="NexVault Bank's agent for processing credit line requests with ESG integration.",
-            url=f"http://{host}:{port}/",
-            version="1.0.0",
-            defaultInputModes=["text/plain"],
-            defaultOutputModes=["text/plain"],
-            capabilities=capabilities,
-            skills=[skill], 
+
+        event_queue = EventQueue()
+
+        if _EXECUTION_GATE.locked():
+            logger.warning("Rejecting send_message: %d agent runs in flight", MAX_CONCURRENT_EXECUTIONS)
+            error_response = {
+                "jsonrpc": "2.0",
+                "id": data.get('id'),
+                "error": {
+                    "code": -32000,
+                    "message": "Server overloaded, retry later"
+                }
+            }
+            return _json_response(error_response, status_code=503)
+        
+        async with _EXECUTION_GATE:
+            await asyncio.wait_for(
+                agent_executor.execute(request_context, event_queue),
+                timeout=300.0 
+            )
+
+        response_body = _SEND_MESSAGE_OK % (
+            orjson.dumps(data.get('id')),
+            orjson.dumps(task_id),
+            orjson.dumps(context_id),
         )
+        
+        return Response(response_body, media_type="application/json")
+        
+    except asyncio.TimeoutError:
+        logger.warning("Agent execution timed out")
+        error_response = {
+            "jsonrpc": "2.0",
+            "id": data.get('id'),
+            "error": {
+                "code": -32603,
+                "message": "Agent execution timed out"
+            }
+        }
+        return _json_response(error_response)
+        
+    except Exception as exec_error:
+        logger.exception("Agent execution error: %s", exec_error)
+        error_response = {
+            "jsonrpc": "2.0",
+            "id": data.get('id'),
+            "error": {
+                "code": -32603,
+                "message": f"Agent execution error: {str(exec_error)}"
+            }
+        }
+        return _json_response(error_response)
+
+
+# JSON-RPC method name -> async handler(data, agent_executor)
+_METHODS = {
+    "send_message": _handle_send_message,
+}
 
+
+def main():
+    """Starts the Tachyon-compatible agent server."""
+    try:
         adk_agent = create_agent()
 
         runner = Runner(
-            app_name=agent_card.name,
+            app_name=AGENT_CARD.name,
             agent=adk_agent,
             artifact_service=InMemoryArtifactService(),
             session_service=InMemorySessionService(),
@@ -72,85 +197,25 @@ def main():
         )
 
         server = A2AStarletteApplication(
-            agent_card=agent_card, 
+            agent_card=AGENT_CARD, 
             http_handler=request_handler
         )      
-        app = server.build(agent_card_url='/.well-known/agent-card.json')
+        app = server.build(agent_card_url=AGENT_CARD_URL)
+        # Swap the per-request model_dump card route for the static one
+        app.router.routes[:] = [route for route in app.router.routes if getattr(route, "path", None) != AGENT_CARD_URL]
+        app.add_route(AGENT_CARD_URL, _handle_agent_card, methods=["GET"])
         print("Built app with agent-card.json")
         
         async def handle_jsonrpc(request):
-            """Custom JSON-RPC handler for send_message method"""
+            """Custom JSON-RPC endpoint, dispatching on the method name via _METHODS"""
             try:
                 body = await request.body()
-                data = json.loads(body)
-                
-                if data.get('method') == 'send_message':
-                    params = data.get('params', {})
-                    message = params.get('message', {})
-                    
-                    print(f"📨 Processing send_message: {message}")
-                    
-                    try:
-                        task_id = message.get('taskId', str(uuid.uuid4()))
-                        context_id = message.get('contextId', str(uuid.uuid4()))
-                        
-                        message_parts = []
-                        if 'parts' in message:
-                            for part in message['parts']:
-                                if part.get('type') == 'text':
-                                    message_parts.append(Part(root=TextPart(text=part['text'])))
-                        
-                        request_context = RequestContext(
-                            task_id=task_id,
-                            context_id=context_id,
-                            message=types.UserContent(parts=message_parts) if message_parts else None
-                        )
-
-                        event_queue = EventQueue()
-
-                        import asyncio
-                        await asyncio.wait_for(
-                            agent_executor.execute(request_context, event_queue),
-                            timeout=300.0 
-                        )
-
-                        response_data = {
-                            "jsonrpc": "2.0",
-                            "id": data.get('id'),
-                            "result": {
-                                "taskId": task_id,
-                                "contextId": context_id,
-                                "status": "completed"
-                            }
-                        }
-                        
-                        return JSONResponse(response_data)
-                        
-                    except asyncio.TimeoutError:
-                        print(f"Agent execution timed out")
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "id": data.get('id'),
-                            "error": {
-                                "code": -32603,
-                                "message": "Agent execution timed out"
-                            }
-                        }
-                        return JSONResponse(error_response)
-                        
-                    except Exception as exec_error:
-                        print(f"Agent execution error: {exec_error}")
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "id": data.get('id'),
-                            "error": {
-                                "code": -32603,
-                                "message": f"Agent execution error: {str(exec_error)}"
-                            }
-                        }
-                        return JSONResponse(error_response)
-                        
-                else:
+                data = orjson.loads(body)
+                if not isinstance(data, dict):
+                    return Response(_INVALID_REQUEST, media_type="application/json")
+
+                handler = _METHODS.get(data.get('method'))
+                if handler is None:
                     error_response = {
                         "jsonrpc": "2.0",
                         "id": data.get('id'),
@@ -159,10 +224,15 @@ def main():
                             "message": "Method not found"
                         }
                     }
-                    return JSONResponse(error_response)
+                    return _json_response(error_response)
+
+                return await handler(data, agent_executor)
                     
+            except orjson.JSONDecodeError:
+                return Response(_PARSE_ERROR, media_type="application/json")
+
             except Exception as e:
-                print(f"JSON-RPC handler error: {e}")
+                logger.exception("JSON-RPC handler error: %s", e)
                 error_response = {
                     "jsonrpc": "2.0",
                     "id": data.get('id') if 'data' in locals() else None,
@@ -171,17 +241,17 @@ def main():
                         "message": f"Internal error: {str(e)}"
                     }
                 }
-                return JSONResponse(error_response)
+                return _json_response(error_response)
         
         app.add_route("/", handle_jsonrpc, methods=["POST"])
 
         print("Starting NexVault Bank Agent (Tachyon A2A Server)")
-        print(f"Agent Card: {agent_card.name}")
-        uvicorn.run(app, host=host, port=port, log_level="info")
+        print(f"Agent Card: {AGENT_CARD.name}")
+        # A single worker is required: sessions and tasks live in in-memory stores.
+        uvicorn.run(app, host=HOST, port=PORT, log_level="info", access_log=False)
 
     except Exception as e:
         logger.error(f"An error occurred during server startup: {e}")
-        import traceback
         traceback.print_exc()
         exit(1)
 
@@ -1,9 +1,10 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, fields
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-import json
+from typing import List, Optional, Dict, Any, Mapping, Sequence
 import hashlib
+import orjson
 from enum import Enum
+from types import MappingProxyType
 
 # === Bank Internal Policies Configuration for Corporate Line of Credit Evaluation ===
 
@@ -27,9 +28,117 @@ class CollateralType(Enum):
     SECURITIES = "securities"
     CASH_DEPOSITS = "cash_deposits"
 
+# Default policy tables, built once and shared read-only by every BankPoliciesConfig
+# (mappings are MappingProxyType views, lists are tuples, all the way down)
+_DEFAULT_RISK_PREMIUM_RATES = MappingProxyType({
+    IndustryRiskLevel.LOW: -0.25,
+    IndustryRiskLevel.MEDIUM: 0.25,
+    IndustryRiskLevel.HIGH: 1.0,
+    IndustryRiskLevel.VERY_HIGH: 3.0
+})
+_DEFAULT_CREDIT_SCORE_ADJUSTMENTS = MappingProxyType({
+    CreditRating.EXCELLENT: -0.75,
+    CreditRating.GOOD: -0.25,
+    CreditRating.FAIR: 2.0,
+    CreditRating.POOR: 10.0
+})
+_DEFAULT_ACCEPTABLE_COLLATERAL_TYPES = (
+    CollateralType.REAL_ESTATE,
+    CollateralType.EQUIPMENT,
+    CollateralType.ACCOUNTS_RECEIVABLE,
+    CollateralType.SECURITIES,
+    CollateralType.CASH_DEPOSITS
+)
+_DEFAULT_COLLATERAL_VALUATION_DISCOUNT_RATES = MappingProxyType({
+    CollateralType.REAL_ESTATE: 0.10,
+    CollateralType.EQUIPMENT: 0.15,
+    CollateralType.INVENTORY: 0.30,
+    CollateralType.ACCOUNTS_RECEIVABLE: 0.05,
+    CollateralType.SECURITIES: 0.10,
+    CollateralType.CASH_DEPOSITS: 0.0
+})
+_DEFAULT_INDUSTRY_RISK_LEVELS = MappingProxyType({
+    "utilities": IndustryRiskLevel.LOW,
+    "healthcare_services": IndustryRiskLevel.LOW,
+    "food_processing": IndustryRiskLevel.LOW,
+    "pharmaceuticals": IndustryRiskLevel.LOW,
+    "consumer_staples": IndustryRiskLevel.LOW,
+    "telecommunications": IndustryRiskLevel.LOW,
+    "insurance": IndustryRiskLevel.LOW,
+    "banking_financial": IndustryRiskLevel.LOW,
+    "technology_software": IndustryRiskLevel.MEDIUM,
+    "manufacturing": IndustryRiskLevel.MEDIUM,
+    "professional_services": IndustryRiskLevel.MEDIUM,
+    "aerospace_defense": IndustryRiskLevel.MEDIUM,
+    "automotive": IndustryRiskLevel.MEDIUM,
+    "retail_trade": IndustryRiskLevel.HIGH,
+    "transportation": IndustryRiskLevel.HIGH,
+    "construction": IndustryRiskLevel.HIGH,
+    "energy_traditional": IndustryRiskLevel.HIGH,
+    "hospitality": IndustryRiskLevel.VERY_HIGH,
+    "real_estate": IndustryRiskLevel.VERY_HIGH,
+    "cryptocurrency": IndustryRiskLevel.VERY_HIGH,
+    "gambling": IndustryRiskLevel.VERY_HIGH,
+    "adult_entertainment": IndustryRiskLevel.VERY_HIGH,
+    "cannabis": IndustryRiskLevel.VERY_HIGH,
+    "mining": IndustryRiskLevel.VERY_HIGH,
+    "oil_gas": IndustryRiskLevel.VERY_HIGH
+})
+_DEFAULT_PROHIBITED_INDUSTRIES = (
+    "illegal_activities",
+    "money_laundering",
+    "terrorist_financing", 
+    "weapons_manufacturing",
+    "tobacco_manufacturing",
+    "payday_lending",
+    "cryptocurrency",
+    "gambling",
+    "adult_entertainment",
+    "cannabis",
+    "oil_gas",
+    "mining",
+    "hospitality",
+    "real_estate_development",
+    "startups",
+    "venture_capital_backed"
+)
+_DEFAULT_APPROVAL_LIMITS = MappingProxyType({
+    "loan_officer": 5_000_000.0,
+    "senior_loan_officer": 15_000_000.0,
+    "credit_manager": 25_000_000.0,
+    "senior_credit_manager": 50_000_000.0,
+    "chief_credit_officer": 75_000_000.0,
+    "loan_committee": 100_000_000.0
+})
+_DEFAULT_LOAN_PURPOSE_DURATION_LIMITS = MappingProxyType({
+    "working_capital": MappingProxyType({"max_duration": 36, "min_duration": 12}),
+    "inventory_financing": MappingProxyType({"max_duration": 24, "min_duration": 6}),
+    "equipment_purchase": MappingProxyType({"max_duration": 60, "min_duration": 24}),
+    "business_expansion": MappingProxyType({"max_duration": 84, "min_duration": 36}),
+    "general_business_purposes": MappingProxyType({"max_duration": 48, "min_duration": 12}),
+    "cash_flow_management": MappingProxyType({"max_duration": 24, "min_duration": 6}),
+    "seasonal_financing": MappingProxyType({"max_duration": 18, "min_duration": 3}),
+    "bridge_financing": MappingProxyType({"max_duration": 12, "min_duration": 3}),
+    "acquisition_financing": MappingProxyType({"max_duration": 72, "min_duration": 24}),
+    "refinancing": MappingProxyType({"max_duration": 60, "min_duration": 12}),
+    "debt_consolidation": MappingProxyType({"max_duration": 60, "min_duration": 12})
+})
+
+def _thaw_policy_value(value: Any) -> Any:
+    """Recursively copy read-only policy tables into plain dicts and lists"""
+    if isinstance(value, Mapping):
+        return {key: _thaw_policy_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw_policy_value(item) for item in value]
+    return value
+
 @dataclass
 class BankPoliciesConfig:
-    """Configuration class containing all bank internal policies for line of credit evaluation"""
+    """Configuration class containing all bank internal policies for line of credit evaluation
+
+    The policy tables default to shared read-only module constants, which dataclasses.asdict()
+    cannot deep-copy; use to_dict() for a plain-dict snapshot.
+    """
     # MINIMUM ELIGIBILITY CRITERIA - ULTRA-PREMIUM BANK
     min_annual_revenue: float = 100_000_000.0  # Minimum $100M annual revenue
     min_years_in_business: int = 10  # Minimum 10 years in operation
@@ -44,18 +153,18 @@ class BankPoliciesConfig:
     # DYNAMIC LENDING RATIO MODEL - ULTRA-PREMIUM BANK
     base_lending_ratio: float = 0.05  # Base 5% of annual revenue for lending decisions
     # REPAYMENT DURATION POLICIES
-    loan_purpose_duration_limits: Dict[str, Dict[str, int]] = None
+    loan_purpose_duration_limits: Mapping[str, Mapping[str, int]] = None
     # INTEREST RATES AND FEES (Annual Percentage) - ULTRA-PREMIUM BANK
     base_interest_rate: float = 4.5  # Base rate (premium rates for premium clients)
-    risk_premium_rates: Dict[IndustryRiskLevel, float] = None
-    credit_score_adjustments: Dict[CreditRating, float] = None
+    risk_premium_rates: Mapping[IndustryRiskLevel, float] = None
+    credit_score_adjustments: Mapping[CreditRating, float] = None
     # COLLATERAL REQUIREMENTS - ULTRA-PREMIUM BANK
     min_collateral_coverage_ratio: float = 1.25  # 125% collateral coverage (premium clients get better terms)
-    acceptable_collateral_types: List[CollateralType] = None
-    collateral_valuation_discount_rates: Dict[CollateralType, float] = None
+    acceptable_collateral_types: Sequence[CollateralType] = None
+    collateral_valuation_discount_rates: Mapping[CollateralType, float] = None
     # INDUSTRY RISK CLASSIFICATIONS
-    industry_risk_levels: Dict[str, IndustryRiskLevel] = None
-    prohibited_industries: List[str] = None
+    industry_risk_levels: Mapping[str, IndustryRiskLevel] = None
+    prohibited_industries: Sequence[str] = None
     # FINANCIAL RATIO REQUIREMENTS - ULTRA-PREMIUM BANK
     max_leverage_ratio: float = 2.0  # Maximum total debt / EBITDA
     min_interest_coverage_ratio: float = 5.0  # EBITDA / Interest Expense
@@ -66,7 +175,7 @@ class BankPoliciesConfig:
     required_tax_returns_years: int = 7
     audit_requirement_threshold: float = 0.0  # Audited statements always required
     # APPROVAL LIMITS (by credit officer level)
-    approval_limits: Dict[str, float] = None
+    approval_limits: Mapping[str, float] = None
     # MONITORING AND COVENANTS - ULTRA-PREMIUM BANK
     financial_covenant_testing_frequency: str = "monthly"
     required_financial_reporting_frequency: str = "monthly"
@@ -77,116 +186,29 @@ class BankPoliciesConfig:
     max_guarantor_age: int = 60
     def __post_init__(self):
         if self.risk_premium_rates is None:
-            self.risk_premium_rates = {
-                IndustryRiskLevel.LOW: -0.25,
-                IndustryRiskLevel.MEDIUM: 0.25,
-                IndustryRiskLevel.HIGH: 1.0,
-                IndustryRiskLevel.VERY_HIGH: 3.0
-            }
+            self.risk_premium_rates = _DEFAULT_RISK_PREMIUM_RATES
         if self.credit_score_adjustments is None:
-            self.credit_score_adjustments = {
-                CreditRating.EXCELLENT: -0.75,
-                CreditRating.GOOD: -0.25,
-                CreditRating.FAIR: 2.0,
-                CreditRating.POOR: 10.0
-            }
+            self.credit_score_adjustments = _DEFAULT_CREDIT_SCORE_ADJUSTMENTS
         if self.acceptable_collateral_types is None:
-            self.acceptable_collateral_types = [
-                CollateralType.REAL_ESTATE,
-                CollateralType.EQUIPMENT,
-                CollateralType.ACCOUNTS_RECEIVABLE,
-                CollateralType.SECURITIES,
-                CollateralType.CASH_DEPOSITS
-            ]
+            self.acceptable_collateral_types = _DEFAULT_ACCEPTABLE_COLLATERAL_TYPES
         if self.collateral_valuation_discount_rates is None:
-            self.collateral_valuation_discount_rates = {
-                CollateralType.REAL_ESTATE: 0.10,
-                CollateralType.EQUIPMENT: 0.15,
-                CollateralType.INVENTORY: 0.30,
-                CollateralType.ACCOUNTS_RECEIVABLE: 0.05,
-                CollateralType.SECURITIES: 0.10,
-                CollateralType.CASH_DEPOSITS: 0.0
-            }
+            self.collateral_valuation_discount_rates = _DEFAULT_COLLATERAL_VALUATION_DISCOUNT_RATES
         if self.industry_risk_levels is None:
-            self.industry_risk_levels = {
-                "utilities": IndustryRiskLevel.LOW,
-                "healthcare_services": IndustryRiskLevel.LOW,
-                "food_processing": IndustryRiskLevel.LOW,
-                "pharmaceuticals": IndustryRiskLevel.LOW,
-                "consumer_staples": IndustryRiskLevel.LOW,
-                "telecommunications": IndustryRiskLevel.LOW,
-                "insurance": IndustryRiskLevel.LOW,
-                "banking_financial": IndustryRiskLevel.LOW,
-                "technology_software": IndustryRiskLevel.MEDIUM,
-                "manufacturing": IndustryRiskLevel.MEDIUM,
-                "professional_services": IndustryRiskLevel.MEDIUM,
-                "aerospace_defense": IndustryRiskLevel.MEDIUM,
-                "automotive": IndustryRiskLevel.MEDIUM,
-                "retail_trade": IndustryRiskLevel.HIGH,
-                "transportation": IndustryRiskLevel.HIGH,
-                "construction": IndustryRiskLevel.HIGH,
-                "energy_traditional": IndustryRiskLevel.HIGH,
-                "hospitality": IndustryRiskLevel.VERY_HIGH,
-                "real_estate": IndustryRiskLevel.VERY_HIGH,
-                "cryptocurrency": IndustryRiskLevel.VERY_HIGH,
-                "gambling": IndustryRiskLevel.VERY_HIGH,
-                "adult_entertainment": IndustryRiskLevel.VERY_HIGH,
-                "cannabis": IndustryRiskLevel.VERY_HIGH,
-                "mining": IndustryRiskLevel.VERY_HIGH,
-                "oil_gas": IndustryRiskLevel.VERY_HIGH
-            }
+            self.industry_risk_levels = _DEFAULT_INDUSTRY_RISK_LEVELS
         if self.prohibited_industries is None:
-            self.prohibited_industries = [
-                "illegal_activities",
-                "money_laundering",
-                "terrorist_financing", 
-                "weapons_manufacturing",
-                "tobacco_manufacturing",
-                "payday_lending",
-                "cryptocurrency",
-                "gambling",
-                "adult_entertainment",
-                "cannabis",
-                "oil_gas",
-                "mining",
-                "hospitality",
-                "real_estate_development",
-                "startups",
-                "venture_capital_backed"
-            ]
+            self.prohibited_industries = _DEFAULT_PROHIBITED_INDUSTRIES
         if self.approval_limits is None:
-            self.approval_limits = {
-                "loan_officer": 5_000_000.0,
-                "senior_loan_officer": 15_000_000.0,
-                "credit_manager": 25_000_000.0,
-                "senior_credit_manager": 50_000_000.0,
-                "chief_credit_officer": 75_000_000.0,
-                "loan_committee": 100_000_000.0
-            }
+            self.approval_limits = _DEFAULT_APPROVAL_LIMITS
         if self.loan_purpose_duration_limits is None:
-            self.loan_purpose_duration_limits = {
-                "working_capital": {"max_duration": 36, "min_duration": 12},
-                "working capital": {"max_duration": 36, "min_duration": 12},
-                "inventory_financing": {"max_duration": 24, "min_duration": 6},
-                "inventory financing": {"max_duration": 24, "min_duration": 6},
-                "equipment_purchase": {"max_duration": 60, "min_duration": 24},
-                "equipment purchase": {"max_duration": 60, "min_duration": 24},
-                "business_expansion": {"max_duration": 84, "min_duration": 36},
-                "business expansion": {"max_duration": 84, "min_duration": 36},
-                "general_business_purposes": {"max_duration": 48, "min_duration": 12},
-                "general business purposes": {"max_duration": 48, "min_duration": 12},
-                "cash_flow_management": {"max_duration": 24, "min_duration": 6},
-                "cash flow management": {"max_duration": 24, "min_duration": 6},
-                "seasonal_financing": {"max_duration": 18, "min_duration": 3},
-                "seasonal financing": {"max_duration": 18, "min_duration": 3},
-                "bridge_financing": {"max_duration": 12, "min_duration": 3},
-                "bridge financing": {"max_duration": 12, "min_duration": 3},
-                "acquisition_financing": {"max_duration": 72, "min_duration": 24},
-                "acquisition financing": {"max_duration": 72, "min_duration": 24},
-                "refinancing": {"max_duration": 60, "min_duration": 12},
-                "debt_consolidation": {"max_duration": 60, "min_duration": 12},
-                "debt consolidation": {"max_duration": 60, "min_duration": 12}
-            }
+            self.loan_purpose_duration_limits = _DEFAULT_LOAN_PURPOSE_DURATION_LIMITS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict/list copy of every policy field (the asdict() equivalent)"""
+        return {policy.name: _thaw_policy_value(getattr(self, policy.name)) for policy in fields(self)}
+
+    def get_duration_limits(self, purpose: str) -> Optional[Mapping[str, int]]:
+        """Duration limits for a loan purpose; keys are stored once, in underscore form"""
+        return self.loan_purpose_duration_limits.get(purpose.strip().lower().replace(" ", "_"))
 
 # REQUIRED APPLICATION FIELDS
 class RequiredApplicationFields:
@@ -323,7 +345,7 @@ VALIDATION_RULES = {
     "sanctions_screening": True
 }
 
-@dataclass
+@dataclass(slots=True)
 class Consumer:
     """Company information for credit requests."""
     company_id: str
@@ -348,7 +370,7 @@ class Consumer:
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CreditRequest:
     """Credit request details."""
     amount: float
@@ -360,7 +382,7 @@ class CreditRequest:
     collateral_description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ESGRequirements:
     """ESG requirements for the credit request."""
     esg_weight: float = 0.3  # Weight given to ESG factors (0-1)
@@ -373,7 +395,7 @@ class ESGRequirements:
             self.social_impact_focus = []
 
 
-@dataclass
+@dataclass(slots=True)
 class DigitalSignature:
     """Digital signature for authentication."""
     algorithm: str
@@ -381,7 +403,37 @@ class DigitalSignature:
     public_key: str
 
 
-@dataclass
+# Intent.from_dict lookup tables: (dataclass field, flat intent key, default)
+_CONSUMER_FIELD_MAP = (
+    ("credit_score", "credit_score", 0),
+    ("years_in_business", "yearsinbusiness", 0),
+    ("industry", "industry_code", ""),
+    ("tax_id", "tax_id", ""),
+    ("jurisdiction", "jurisdiction", ""),
+    ("registration_number", "company_registration_number", ""),
+    ("contact_email", "sender_contact_email", ""),
+    ("credit_report_ref", "credit_report_ref", ""),
+    ("esg_certifications", "esg_certifications", ""),
+    ("esg_reporting_url", "esg_reporting_url", ""),
+    ("regulatory_context_jurisdiction", "regulatory_context_jurisdiction", ""),
+    ("regulatory_context_related_disclosure", "regulatory_context_related_disclosure", ""),
+    ("data_sharing_consent", "data_sharing_consent", False),
+    ("signature", "signature", ""),
+)
+# Read from the nested "financials" object first, then from the flat key
+_CONSUMER_FINANCIAL_FIELDS = ("annual_revenue", "net_income", "assets_total", "liabilities_total")
+_CREDIT_REQUEST_FIELD_MAP = (
+    ("amount", "amount_value", 0.0),
+    ("duration", "repayment_duration", 0),
+    ("purpose", "purpose", ""),
+    ("preferred_interest_rate", "preferred_interest_rate", None),
+    ("repayment_preference", "repayment_preference", None),
+    ("drawdown_type", "drawdown_type", None),
+    ("collateral_description", "collateral_description", None),
+)
+
+
+@dataclass(slots=True)
 class Intent:
     """Credit request intent sent by consumer agent."""
     request_id: str
@@ -400,46 +452,47 @@ class Intent:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization, flattening for compatibility with new JSON structure."""
-        data = asdict(self)
-        # Flatten nested objects for compatibility with new JSON structure
-        data['intent_id'] = self.request_id
-        data['created_at'] = self.timestamp.isoformat() if isinstance(self.timestamp, datetime) else str(self.timestamp)
-        data['amount_value'] = self.credit_request.amount
-        data['repayment_duration'] = self.credit_request.duration
-        data['purpose'] = self.credit_request.purpose
-        data['preferred_interest_rate'] = self.credit_request.preferred_interest_rate
-        data['repayment_preference'] = self.credit_request.repayment_preference
-        data['drawdown_type'] = self.credit_request.drawdown_type
-        data['collateral_description'] = self.credit_request.collateral_description
-        # Consumer fields
-        data['sender_name'] = self.consumer.company_name
-        data['sender_id'] = self.consumer.company_id
-        data['sender_contact_email'] = self.consumer.contact_email
-        data['company_registration_number'] = self.consumer.registration_number
-        data['jurisdiction'] = self.consumer.jurisdiction
-        data['industry_code'] = self.consumer.industry
-        data['tax_id'] = self.consumer.tax_id
-        data['financials'] = {
-            "annual_revenue": self.consumer.annual_revenue,
-            "net_income": self.consumer.net_income,
-            "assets_total": self.consumer.assets_total,
-            "liabilities_total": self.consumer.liabilities_total,
+        consumer = self.consumer
+        credit_request = self.credit_request
+        # Built directly instead of asdict() + overwrites + pops; the key order is unchanged
+        return {
+            "esg_requirements": asdict(self.esg_requirements) if self.esg_requirements is not None else None,
+            "digital_signature": asdict(self.digital_signature) if self.digital_signature is not None else None,
+            "protocol_version": self.protocol_version,
+            # Consumer fields take precedence over the top-level sender fields
+            "sender_id": consumer.company_id,
+            "sender_name": consumer.company_name,
+            "sender_contact_email": consumer.contact_email,
+            "signature": consumer.signature,
+            "yearsinbusiness": self.yearsinbusiness,
+            "ESG_impact_ratio": self.ESG_impact_ratio,
+            # Flatten nested objects for compatibility with new JSON structure
+            "intent_id": self.request_id,
+            "created_at": self.timestamp.isoformat() if isinstance(self.timestamp, datetime) else str(self.timestamp),
+            "amount_value": credit_request.amount,
+            "repayment_duration": credit_request.duration,
+            "purpose": credit_request.purpose,
+            "preferred_interest_rate": credit_request.preferred_interest_rate,
+            "repayment_preference": credit_request.repayment_preference,
+            "drawdown_type": credit_request.drawdown_type,
+            "collateral_description": credit_request.collateral_description,
+            "company_registration_number": consumer.registration_number,
+            "jurisdiction": consumer.jurisdiction,
+            "industry_code": consumer.industry,
+            "tax_id": consumer.tax_id,
+            "financials": {
+                "annual_revenue": consumer.annual_revenue,
+                "net_income": consumer.net_income,
+                "assets_total": consumer.assets_total,
+                "liabilities_total": consumer.liabilities_total,
+            },
+            "credit_report_ref": consumer.credit_report_ref,
+            "esg_certifications": consumer.esg_certifications,
+            "esg_reporting_url": consumer.esg_reporting_url,
+            "regulatory_context_jurisdiction": consumer.regulatory_context_jurisdiction,
+            "regulatory_context_related_disclosure": consumer.regulatory_context_related_disclosure,
+            "data_sharing_consent": consumer.data_sharing_consent,
         }
-        data['credit_report_ref'] = self.consumer.credit_report_ref
-        data['esg_certifications'] = self.consumer.esg_certifications
-        data['esg_reporting_url'] = self.consumer.esg_reporting_url
-        data['regulatory_context_jurisdiction'] = self.consumer.regulatory_context_jurisdiction
-        data['regulatory_context_related_disclosure'] = self.consumer.regulatory_context_related_disclosure
-        data['data_sharing_consent'] = self.consumer.data_sharing_consent
-        data['signature'] = self.consumer.signature
-        data['yearsinbusiness'] = self.yearsinbusiness
-        data['ESG_impact_ratio'] = self.ESG_impact_ratio
-        # Remove nested objects to avoid duplication
-        data.pop('consumer', None)
-        data.pop('credit_request', None)
-        data.pop('request_id', None)
-        data.pop('timestamp', None)
-        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Intent':
@@ -451,41 +504,19 @@ class Intent:
                 timestamp = datetime.fromisoformat(timestamp)
             except Exception:
                 timestamp = datetime.now()
+        get = data.get
+        sender_id = get("sender_id", "")
+        sender_name = get("sender_name", "")
         # Consumer
-        consumer_fields = {
-            "company_id": data.get("sender_id") or data.get("company_id"),
-            "company_name": data.get("sender_name") or data.get("company_name"),
-            "credit_score": data.get("credit_score", 0),
-            "annual_revenue": data.get("financials", {}).get("annual_revenue", data.get("annual_revenue", 0.0)),
-            "years_in_business": data.get("yearsinbusiness", 0),
-            "industry": data.get("industry_code", ""),
-            "tax_id": data.get("tax_id", ""),
-            "jurisdiction": data.get("jurisdiction", ""),
-            "registration_number": data.get("company_registration_number", ""),
-            "contact_email": data.get("sender_contact_email", ""),
-            "net_income": data.get("financials", {}).get("net_income", data.get("net_income", 0.0)),
-            "assets_total": data.get("financials", {}).get("assets_total", data.get("assets_total", 0.0)),
-            "liabilities_total": data.get("financials", {}).get("liabilities_total", data.get("liabilities_total", 0.0)),
-            "credit_report_ref": data.get("credit_report_ref", ""),
-            "esg_certifications": data.get("esg_certifications", ""),
-            "esg_reporting_url": data.get("esg_reporting_url", ""),
-            "regulatory_context_jurisdiction": data.get("regulatory_context_jurisdiction", ""),
-            "regulatory_context_related_disclosure": data.get("regulatory_context_related_disclosure", ""),
-            "data_sharing_consent": data.get("data_sharing_consent", False),
-            "signature": data.get("signature", ""),
-        }
+        consumer_fields = {field: get(key, default) for field, key, default in _CONSUMER_FIELD_MAP}
+        consumer_fields["company_id"] = sender_id or get("company_id")
+        consumer_fields["company_name"] = sender_name or get("company_name")
+        financials = get("financials") or {}
+        for field in _CONSUMER_FINANCIAL_FIELDS:
+            consumer_fields[field] = financials.get(field, get(field, 0.0))
         consumer = Consumer(**consumer_fields)
         # CreditRequest
-        credit_request_fields = {
-            "amount": data.get("amount_value", 0.0),
-            "duration": data.get("repayment_duration", 0),
-            "purpose": data.get("purpose", ""),
-            "preferred_interest_rate": data.get("preferred_interest_rate"),
-            "repayment_preference": data.get("repayment_preference"),
-            "drawdown_type": data.get("drawdown_type"),
-            "collateral_description": data.get("collateral_description"),
-        }
-        credit_request = CreditRequest(**credit_request_fields)
+        credit_request = CreditRequest(**{field: get(key, default) for field, key, default in _CREDIT_REQUEST_FIELD_MAP})
         # ESG Requirements
         esg_requirements = None
         if data.get('esg_requirements'):
@@ -503,8 +534,8 @@ class Intent:
             esg_requirements=esg_requirements,
             digital_signature=digital_signature,
             protocol_version=data.get("protocol_version", "WFAP-1.0"),
-            sender_id=data.get("sender_id", ""),
-            sender_name=data.get("sender_name", ""),
+            sender_id=sender_id,
+            sender_name=sender_name,
             sender_contact_email=data.get("sender_contact_email", ""),
             signature=data.get("signature", ""),
             yearsinbusiness=data.get("yearsinbusiness"),
@@ -517,8 +548,8 @@ class Intent:
             ts = self.timestamp.isoformat()
         else:
             ts = str(self.timestamp)
-        content = f"{self.request_id}{ts}{self.consumer.company_id}"
-        signature = hashlib.sha256(f"{content}{private_key}".encode()).hexdigest()
+        # One f-string and one encode; same bytes (and digest) as content + private_key
+        signature = hashlib.sha256(f"{self.request_id}{ts}{self.consumer.company_id}{private_key}".encode()).hexdigest()
         self.digital_signature = DigitalSignature(
             algorithm="SHA256",
             signature=signature,
@@ -526,7 +557,7 @@ class Intent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Bank:
     """Bank information."""
     bank_id: str
@@ -535,7 +566,7 @@ class Bank:
     regulatory_license: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OfferTerms:
     """Terms of the credit offer."""
     approved_amount: float
@@ -546,7 +577,7 @@ class OfferTerms:
     drawing_period: int = 12  # months
 
 
-@dataclass
+@dataclass(slots=True)
 class ESGImpact:
     """ESG impact assessment."""
     carbon_footprint: float
@@ -560,7 +591,7 @@ class ESGImpact:
             self.sustainability_initiatives = []
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceCheck:
     """Individual compliance check result."""
     check_type: str
@@ -568,7 +599,7 @@ class ComplianceCheck:
     details: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAssessment:
     """Risk assessment for the offer."""
     risk_level: str  # "low", "medium", "high"
@@ -579,14 +610,14 @@ class RiskAssessment:
             self.risk_factors = []
 
 
-@dataclass
+@dataclass(slots=True)
 class RegulatoryCompliance:
     """Regulatory compliance information."""
     compliance_checks: List[ComplianceCheck]
     risk_assessment: RiskAssessment
 
 
-@dataclass
+@dataclass(slots=True)
 class Offer:
     """Credit offer from bank agent."""
     offer_id: str
@@ -597,20 +628,81 @@ class Offer:
     esg_impact: ESGImpact
     regulatory_compliance: RegulatoryCompliance
     digital_signature: Optional[DigitalSignature] = None
+    # Derived figures, computed once in __post_init__ (offers are not mutated after construction)
+    total_cost: float = field(init=False, repr=False, compare=False)
+    carbon_adjusted_rate: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        offer_terms = self.offer_terms
+        base_cost = offer_terms.approved_amount * (offer_terms.interest_rate / 100)
+        total_fees = offer_terms.origination_fee + offer_terms.annual_fee
+        self.total_cost = base_cost + total_fees
+        carbon_penalty = self.esg_impact.carbon_footprint * 0.01  # 0.01% per carbon unit
+        self.carbon_adjusted_rate = offer_terms.interest_rate + carbon_penalty
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        # Handle timestamp serialization safely
-        if hasattr(self.timestamp, 'isoformat'):
-            data['timestamp'] = self.timestamp.isoformat()
-        else:
-            data['timestamp'] = str(self.timestamp)
-        return data
+        esg_impact = self.esg_impact
+        regulatory_compliance = self.regulatory_compliance
+        risk_assessment = regulatory_compliance.risk_assessment
+        bank = self.bank
+        offer_terms = self.offer_terms
+        digital_signature = self.digital_signature
+        # Built field by field instead of the recursive asdict() walk (the slotted
+        # dataclasses have no __dict__); the list fields are still copied so callers
+        # cannot mutate the offer through the result
+        return {
+            "offer_id": self.offer_id,
+            "request_id": self.request_id,
+            # Handle timestamp serialization safely
+            "timestamp": self.timestamp.isoformat() if hasattr(self.timestamp, 'isoformat') else str(self.timestamp),
+            "bank": {
+                "bank_id": bank.bank_id,
+                "bank_name": bank.bank_name,
+                "bank_token": bank.bank_token,
+                "regulatory_license": bank.regulatory_license,
+            },
+            "offer_terms": {
+                "approved_amount": offer_terms.approved_amount,
+                "interest_rate": offer_terms.interest_rate,
+                "repayment_period": offer_terms.repayment_period,
+                "origination_fee": offer_terms.origination_fee,
+                "annual_fee": offer_terms.annual_fee,
+                "drawing_period": offer_terms.drawing_period,
+            },
+            "esg_impact": {
+                "carbon_footprint": esg_impact.carbon_footprint,
+                "carbon_adjusted_rate": esg_impact.carbon_adjusted_rate,
+                "esg_score": esg_impact.esg_score,
+                "esg_summary": esg_impact.esg_summary,
+                "sustainability_initiatives": list(esg_impact.sustainability_initiatives),
+            },
+            "regulatory_compliance": {
+                "compliance_checks": [
+                    {"check_type": check.check_type, "status": check.status, "details": check.details}
+                    for check in regulatory_compliance.compliance_checks
+                ],
+                "risk_assessment": {
+                    "risk_level": risk_assessment.risk_level,
+                    "risk_factors": list(risk_assessment.risk_factors),
+                },
+            },
+            "digital_signature": {
+                "algorithm": digital_signature.algorithm,
+                "signature": digital_signature.signature,
+                "public_key": digital_signature.public_key,
+            } if digital_signature is not None else None,
+        }
 
     def to_json(self) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        """Convert to JSON string.
+
+        Non-finite floats (NaN, Infinity) are written as null.
+        """
+        # orjson writes UTF-8 directly, matching the old ensure_ascii=False output. Unlike
+        # json.dumps it emits null for NaN/Infinity instead of the non-standard NaN token, and
+        # OPT_NON_STR_KEYS is not needed because to_dict() only produces str keys
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Offer':
@@ -634,8 +726,10 @@ class Offer:
 
     def create_signature(self, private_key: str = "default_key") -> None:
         """Create a simple digital signature for the offer."""
-        content = f"{self.offer_id}{self.request_id}{self.timestamp.isoformat()}{self.bank.bank_id}"
-        signature = hashlib.sha256(f"{content}{private_key}".encode()).hexdigest()
+        # One f-string and one encode; same bytes (and digest) as content + private_key
+        signature = hashlib.sha256(
+            f"{self.offer_id}{self.request_id}{self.timestamp.isoformat()}{self.bank.bank_id}{private_key}".encode()
+        ).hexdigest()
         self.digital_signature = DigitalSignature(
             algorithm="SHA256",
             signature=signature,
@@ -644,14 +738,11 @@ class Offer:
 
     def calculate_total_cost(self) -> float:
         """Calculate total cost including fees."""
-        base_cost = self.offer_terms.approved_amount * (self.offer_terms.interest_rate / 100)
-        total_fees = self.offer_terms.origination_fee + self.offer_terms.annual_fee
-        return base_cost + total_fees
+        return self.total_cost
 
     def calculate_carbon_adjusted_rate(self) -> float:
         """Calculate carbon-adjusted interest rate."""
-        carbon_penalty = self.esg_impact.carbon_footprint * 0.01  # 0.01% per carbon unit
-        return self.offer_terms.interest_rate + carbon_penalty
+        return self.carbon_adjusted_rate
 
 
 def verify_signature(data: Dict[str, Any], expected_public_key: str) -> bool:
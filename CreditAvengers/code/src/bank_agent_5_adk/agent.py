@@ -1,6 +1,7 @@
+import asyncio
+import logging
 import random
 import json
-import time
 from datetime import date, datetime, timedelta
 from typing import Dict, Any
 from tachyon_adk_client import TachyonAdkClient
@@ -14,14 +15,11 @@ from .bank_policy_tools import (
     negotiate_loan
 )
 
+logger = logging.getLogger(__name__)
 
-def create_agent() -> Agent:
-    """Constructs the ADK agent for Byte Bank."""
-    return Agent(
-        model=TachyonAdkClient(model_name="gemini-2.5-flash"),
-    name="byte_bank_agent",
-    description="A comprehensive Byte Bank agent that processes corporate line of credit applications from initial risk assessment through loan offer generation or intelligent rejection analysis.",
-    instruction="""
+
+# Static agent configuration, built once at import
+_AGENT_INSTRUCTION = """
     I am a bank loan processing agent.
    
     In case the user sends a loan application, I MUST follow this exact workflow(STEP 1,2):
@@ -107,16 +105,33 @@ def create_agent() -> Agent:
     - Give the final response in a single line json, seperated by ';'. 
     
     ***Retry Mechanism:***
-        - While calling any tools, if there are invalid arguments passed or the request is errored due to invalid inputs, please pass the parameters again properly and retry calling the same tool for the same action for 2 times. only if it fails for more than 2 times, then report the error to user.""",
-        
-    tools=[perform_initial_risk_assessment, calculate_interest_rate_and_offer, calculate_final_approved_amount, calculate_approved_repayment_duration, generate_loan_offer_json, negotiate_loan, ]
+        - While calling any tools, if there are invalid arguments passed or the request is errored due to invalid inputs, please pass the parameters again properly and retry calling the same tool for the same action for 2 times. only if it fails for more than 2 times, then report the error to user."""
+_AGENT_TOOLS = (
+    perform_initial_risk_assessment,
+    calculate_interest_rate_and_offer,
+    calculate_final_approved_amount,
+    calculate_approved_repayment_duration,
+    generate_loan_offer_json,
+    negotiate_loan,
+)
+
+
+def create_agent() -> Agent:
+    """Constructs the ADK agent for Byte Bank."""
+    return Agent(
+        model=TachyonAdkClient(model_name="gemini-2.5-flash"),
+    name="byte_bank_agent",
+    description="A comprehensive Byte Bank agent that processes corporate line of credit applications from initial risk assessment through loan offer generation or intelligent rejection analysis.",
+    instruction=_AGENT_INSTRUCTION,
+    tools=list(_AGENT_TOOLS),
     )
 
 
 async def process_credit_request(request_data: dict) -> dict:
-    print(f"[{datetime.now()}] Byte Bank agent received request: {json.dumps(request_data)[:200]}...")
+    if logger.isEnabledFor(logging.DEBUG):  # Only serialize the request when it will be logged
+        logger.debug("[%s] Byte Bank agent received request: %s...", datetime.now(), json.dumps(request_data)[:200])
     start_time = datetime.now()
-    time.sleep(2)
+    await asyncio.sleep(2)
     end_time = datetime.now()
     print(f"[{end_time}] Byte Bank agent finished processing in {(end_time - start_time).total_seconds()} seconds")
     return {"status": "processed", "timestamp": str(end_time)}
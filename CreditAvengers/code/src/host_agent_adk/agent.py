@@ -17,7 +17,7 @@ from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
-from .remote_agent_connection import RemoteAgentConnections
+from .remote_agent_connection import RemoteAgentConnections, close_shared_client
 from .host_tools import build_and_send_credit_request as build_and_send_credit_request_tool,select_best_loan_offer as select_best_loan_offer_tool, send_user_message as send_user_message_tool, display_offers as display_offers_tool
 
 load_dotenv()
@@ -417,6 +417,8 @@ def _get_initialized_consumer_agent_sync():
             remote_agent_addresses=bank_agent_urls
         )
         print("ConsumerAgent initialized")
+        # asyncio.run() closes this loop; the connections rebind on the loop that serves requests
+        await close_shared_client()
         return consumer_agent_instance.create_agent()
 
     try:
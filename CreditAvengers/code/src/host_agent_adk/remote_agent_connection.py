@@ -1,5 +1,6 @@
 from typing import Callable
 import asyncio
+import weakref
 import httpx
 from a2a.client import A2AClient
 from a2a.types import (
@@ -17,14 +18,45 @@ load_dotenv()
 TaskCallbackArg = Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
 TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
 
+# One connection pool per event loop, shared by every remote agent on that loop, so keep-alive
+# connections are reused across banks but never handed to a loop that did not open them
+_SHARED_HTTPX_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_client() -> httpx.AsyncClient:
+    """HTTP client shared by all RemoteAgentConnections on the running event loop (created on first use)"""
+    loop = asyncio.get_running_loop()
+    client = _SHARED_HTTPX_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(300.0, connect=60.0),
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        )
+        _SHARED_HTTPX_CLIENTS[loop] = client
+    return client
+
+
+async def close_shared_client():
+    """Close the running event loop's shared HTTP client (call on shutdown, from that loop)"""
+    client = _SHARED_HTTPX_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class RemoteAgentConnections:
-    """A class to hold the connections to the remote agents."""
+    """A class to hold the connections to the remote agents.
+
+    Must be created on a running event loop; when used from another loop the A2A client is
+    rebound to that loop's shared HTTP client.
+    """
 
     def __init__(self, agent_card: AgentCard, agent_url: str):
         print(f"agent_card: {agent_card}")
         print(f"agent_url: {agent_url}")
-        self._httpx_client = httpx.AsyncClient(timeout=httpx.Timeout(300.0, connect=60.0))
+        self._agent_url = agent_url
+        self._httpx_client = _shared_client()
         self.agent_client = A2AClient(self._httpx_client, agent_card, url=agent_url)
         self.card = agent_card
         self.conversation_name = None
@@ -33,15 +65,10 @@ class RemoteAgentConnections:
         self._closed = False
     
     async def close(self):
-        """Close the HTTP client and cleanup resources"""
-        if not self._closed and self._httpx_client:
-            try:
-                await self._httpx_client.aclose()
-                print(f"Closed HTTP client for {self.card.name}")
-            except Exception as e:
-                print(f"Error closing HTTP client for {self.card.name}: {e}")
-            finally:
-                self._closed = True
+        """Release this connection; the shared HTTP client is closed by close_shared_client()"""
+        if not self._closed:
+            self._closed = True
+            print(f"Released HTTP client for {self.card.name}")
     
     def __del__(self):
         """Destructor to ensure cleanup"""
@@ -62,6 +89,10 @@ class RemoteAgentConnections:
     async def send_message(
         self, message_request: SendMessageRequest
     ) -> SendMessageResponse:
+        httpx_client = _shared_client()
+        if httpx_client is not self._httpx_client:
+            self._httpx_client = httpx_client
+            self.agent_client = A2AClient(httpx_client, self.card, url=self._agent_url)
         try:
             return await asyncio.wait_for(
                 self.agent_client.send_message(message_request), timeout=300.0 
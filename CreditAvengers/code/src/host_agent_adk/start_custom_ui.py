@@ -1,5 +1,6 @@
 try:
     from .web_server import app, initialize_consumer_agent
+    from .remote_agent_connection import close_shared_client
 except ImportError:
     import sys
     from pathlib import Path
@@ -7,6 +8,7 @@ except ImportError:
     if str(current_dir) not in sys.path:
         sys.path.insert(0, str(current_dir))
     from web_server import app, initialize_consumer_agent
+    from remote_agent_connection import close_shared_client
 import asyncio
 import nest_asyncio
 import os
@@ -89,6 +91,8 @@ def main():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             success = loop.run_until_complete(initialize_consumer_agent())
+            # Requests are served on web_server's loop, so this loop's shared HTTP client is not needed
+            loop.run_until_complete(close_shared_client())
             
             if success:
                 print("Consumer agent initialized successfully")
@@ -16,6 +16,7 @@ import sys
 import os
 from .agent import ConsumerAgent
 from .company_config import CorporateConfig
+from .remote_agent_connection import close_shared_client
 
 # Add current directory to Python path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -69,6 +70,13 @@ def cleanup_async_tasks():
     
     try:
         if _global_loop and not _global_loop.is_closed():
+            # Close the remote agents' shared HTTP client on the loop that owns it
+            if _loop_thread and _loop_thread.is_alive():
+                try:
+                    asyncio.run_coroutine_threadsafe(close_shared_client(), _global_loop).result(timeout=2.0)
+                except Exception as e:
+                    logger.error(f"Error closing shared HTTP client: {e}")
+            
             # Cancel all pending tasks
             pending = asyncio.all_tasks(_global_loop)
             for task in pending:
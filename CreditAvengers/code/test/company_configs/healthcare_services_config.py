@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime
+from functools import cached_property
 import os
 import secrets
+from types import MappingProxyType
 
 class CorporateConfig:
     """
@@ -9,44 +11,61 @@ class CorporateConfig:
     Represents a multi-location healthcare provider with stable revenue and heavy regulation compliance.
     """
     
-    def __init__(self):
-        # Core identifiers
-        self.intent_id = str(uuid.uuid4())
-        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
-        self.nonce = secrets.token_hex(16)  # 32-character random hex string
-        self.protocol_version = "WFAP-1.0"
+    # Static profile values, published below as class attributes; from_dict overrides them per instance
+    _DEFAULTS = MappingProxyType({
+        # Core identifiers: created_at is stamped in __init__; intent_id and nonce are random
+        # values generated on first access
+        "protocol_version": "WFAP-1.0",
         
         # Company identifiers
-        self.sender_id = "054321098"  # DUNS number
-        self.sender_name = "Sunshine Medical Group P.A."
-        self.sender_public_jwk_url = "https://secure.sunshinemedical.com/keys/public.jwk"
-        self.company_registration_number = "PA-987654321"  # Florida Professional Association
-        self.jurisdiction = "US-FL"  # Florida, United States
+        "sender_id": "054321098",  # DUNS number
+        "sender_name": "Sunshine Medical Group P.A.",
+        "sender_public_jwk_url": "https://secure.sunshinemedical.com/keys/public.jwk",
+        "company_registration_number": "PA-987654321",  # Florida Professional Association
+        "jurisdiction": "US-FL",  # Florida, United States
         
         # Industry and tax information
-        self.industry_code = "621111"  # NAICS code for Offices of Physicians (except Mental Health Specialists)
-        self.tax_id = "59-1234567"  # EIN format
-        self.ESG_impact_ratio = "0.8"  # High ESG focus due to healthcare mission
-        self.carbon_emissions_tons_co2e = 12500  # Moderate emissions for healthcare facilities (medical equipment, HVAC, transportation)
+        "industry_code": "621111",  # NAICS code for Offices of Physicians (except Mental Health Specialists)
+        "tax_id": "59-1234567",  # EIN format
+        "ESG_impact_ratio": "0.8",  # High ESG focus due to healthcare mission
+        "carbon_emissions_tons_co2e": 12500,  # Moderate emissions for healthcare facilities (medical equipment, HVAC, transportation)
         
         # Financial data (in USD) - Healthcare services with stable recurring revenue
-        self.financials_annual_revenue = 125000000  # $125M
-        self.financials_net_income = 18750000  # $18.75M (15% margin, good for healthcare)
-        self.financials_assets_total = 95000000  # $95M (medical equipment and facilities)
-        self.financials_liabilities_total = 35000000  # $35M
+        "financials_annual_revenue": 125000000,  # $125M
+        "financials_net_income": 18750000,  # $18.75M (15% margin, good for healthcare)
+        "financials_assets_total": 95000000,  # $95M (medical equipment and facilities)
+        "financials_liabilities_total": 35000000,  # $35M
         
         # Credit and ESG information
-        self.credit_report_ref = "DN-77889900"  # D&B reference number
-        self.esg_certifications = "ISO26000,ENERGY STAR,LEED"
-        self.esg_reporting_url = "https://sunshinemedical.com/community-health-impact"
+        "credit_report_ref": "DN-77889900",  # D&B reference number
+        "esg_certifications": "ISO26000,ENERGY STAR,LEED",
+        "esg_reporting_url": "https://sunshinemedical.com/community-health-impact",
         
         # Regulatory information
-        self.regulatory_context_jurisdiction = "CMS,FDA,Florida DOH,HIPAA"
-        self.regulatory_context_required_disclosures = "CMS Quality Reporting,HIPAA Risk Assessments,Florida Medical License Renewals"
+        "regulatory_context_jurisdiction": "CMS,FDA,Florida DOH,HIPAA",
+        "regulatory_context_required_disclosures": "CMS Quality Reporting,HIPAA Risk Assessments,Florida Medical License Renewals",
+    })
+    # Every key that to_dict() emits and from_dict() accepts
+    _FIELDS = frozenset(_DEFAULTS) | {"intent_id", "created_at", "nonce"}
+    
+    def __init__(self):
+        # The request timestamp records when the config was built, not when it is first read
+        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
+    
+    @cached_property
+    def intent_id(self):
+        """Unique identifier for this credit request"""
+        return str(uuid.uuid4())
+    
+    @cached_property
+    def nonce(self):
+        """32-character random hex string"""
+        return secrets.token_hex(16)
     
     def to_dict(self):
         """Convert configuration to dictionary"""
-        return {k: v for k, v in self.__dict__.items()}
+        # Fresh dict, so callers may modify it freely; instance overrides win over the shared defaults
+        return {"intent_id": self.intent_id, "created_at": self.created_at, "nonce": self.nonce, **self._DEFAULTS, **self.__dict__}
     
     def from_dict(self, config_dict):
         """
@@ -55,10 +74,13 @@ class CorporateConfig:
         Args:
             config_dict (dict): Dictionary containing configuration values
         """
-        for key, value in config_dict.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        self.__dict__.update({key: value for key, value in config_dict.items() if key in self._FIELDS})
 
     def __str__(self):
         """String representation of configuration"""
-        return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
\ No newline at end of file
+        return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
+
+# Shared defaults are plain class attributes, so instance reads fall through to the class
+for _field, _value in CorporateConfig._DEFAULTS.items():
+    setattr(CorporateConfig, _field, _value)
+del _field, _value
\ No newline at end of file
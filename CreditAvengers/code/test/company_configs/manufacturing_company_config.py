@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime
+from functools import cached_property
 import os
 import secrets
+from types import MappingProxyType
 
 class CorporateConfig:
     """
@@ -9,44 +11,61 @@ class CorporateConfig:
     Represents a conservative, asset-heavy industrial manufacturer with steady operations.
     """
     
-    def __init__(self):
-        # Core identifiers
-        self.intent_id = str(uuid.uuid4())
-        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
-        self.nonce = secrets.token_hex(16)  # 32-character random hex string
-        self.protocol_version = "WFAP-1.0"
+    # Static profile values, published below as class attributes; from_dict overrides them per instance
+    _DEFAULTS = MappingProxyType({
+        # Core identifiers: created_at is stamped in __init__; intent_id and nonce are random
+        # values generated on first access
+        "protocol_version": "WFAP-1.0",
         
         # Company identifiers
-        self.sender_id = "019876543"  # DUNS number
-        self.sender_name = "Midwest Steel Manufacturing Corp."
-        self.sender_public_jwk_url = "https://portal.midweststeel.com/keys/public.jwk"
-        self.company_registration_number = "C19876543"  # Ohio corporation number format
-        self.jurisdiction = "US-OH"  # Ohio, United States
+        "sender_id": "019876543",  # DUNS number
+        "sender_name": "Midwest Steel Manufacturing Corp.",
+        "sender_public_jwk_url": "https://portal.midweststeel.com/keys/public.jwk",
+        "company_registration_number": "C19876543",  # Ohio corporation number format
+        "jurisdiction": "US-OH",  # Ohio, United States
         
         # Industry and tax information
-        self.industry_code = "331110"  # NAICS code for Iron and Steel Mills and Ferroalloy Manufacturing
-        self.tax_id = "34-5678901"  # EIN format
-        self.ESG_impact_ratio = "0.4"  # Moderate ESG focus, improving sustainability
-        self.carbon_emissions_tons_co2e = 285000  # High emissions for steel manufacturing (energy-intensive processes)
+        "industry_code": "331110",  # NAICS code for Iron and Steel Mills and Ferroalloy Manufacturing
+        "tax_id": "34-5678901",  # EIN format
+        "ESG_impact_ratio": "0.4",  # Moderate ESG focus, improving sustainability
+        "carbon_emissions_tons_co2e": 285000,  # High emissions for steel manufacturing (energy-intensive processes)
         
         # Financial data (in USD) - Established manufacturing with strong assets
-        self.financials_annual_revenue = 185000000  # $185M
-        self.financials_net_income = 14800000  # $14.8M (8% margin)
-        self.financials_assets_total = 320000000  # $320M (heavy in plant & equipment)
-        self.financials_liabilities_total = 125000000  # $125M
+        "financials_annual_revenue": 185000000,  # $185M
+        "financials_net_income": 14800000,  # $14.8M (8% margin)
+        "financials_assets_total": 320000000,  # $320M (heavy in plant & equipment)
+        "financials_liabilities_total": 125000000,  # $125M
         
         # Credit and ESG information
-        self.credit_report_ref = "DN-55667788"  # D&B reference number
-        self.esg_certifications = "ISO14001,ENERGY STAR,SA8000"
-        self.esg_reporting_url = "https://midweststeel.com/environmental-stewardship"
+        "credit_report_ref": "DN-55667788",  # D&B reference number
+        "esg_certifications": "ISO14001,ENERGY STAR,SA8000",
+        "esg_reporting_url": "https://midweststeel.com/environmental-stewardship",
         
         # Regulatory information
-        self.regulatory_context_jurisdiction = "EPA,OSHA,DOT"
-        self.regulatory_context_required_disclosures = "EPA Toxic Release Inventory,OSHA 300 Logs,DOT Hazmat Reports"
+        "regulatory_context_jurisdiction": "EPA,OSHA,DOT",
+        "regulatory_context_required_disclosures": "EPA Toxic Release Inventory,OSHA 300 Logs,DOT Hazmat Reports",
+    })
+    # Every key that to_dict() emits and from_dict() accepts
+    _FIELDS = frozenset(_DEFAULTS) | {"intent_id", "created_at", "nonce"}
+    
+    def __init__(self):
+        # The request timestamp records when the config was built, not when it is first read
+        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
+    
+    @cached_property
+    def intent_id(self):
+        """Unique identifier for this credit request"""
+        return str(uuid.uuid4())
+    
+    @cached_property
+    def nonce(self):
+        """32-character random hex string"""
+        return secrets.token_hex(16)
     
     def to_dict(self):
         """Convert configuration to dictionary"""
-        return {k: v for k, v in self.__dict__.items()}
+        # Fresh dict, so callers may modify it freely; instance overrides win over the shared defaults
+        return {"intent_id": self.intent_id, "created_at": self.created_at, "nonce": self.nonce, **self._DEFAULTS, **self.__dict__}
     
     def from_dict(self, config_dict):
         """
@@ -55,10 +74,13 @@ class CorporateConfig:
         Args:
             config_dict (dict): Dictionary containing configuration values
         """
-        for key, value in config_dict.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        self.__dict__.update({key: value for key, value in config_dict.items() if key in self._FIELDS})
 
     def __str__(self):
         """String representation of configuration"""
-        return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
\ No newline at end of file
+        return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
+
+# Shared defaults are plain class attributes, so instance reads fall through to the class
+for _field, _value in CorporateConfig._DEFAULTS.items():
+    setattr(CorporateConfig, _field, _value)
+del _field, _value
\ No newline at end of file
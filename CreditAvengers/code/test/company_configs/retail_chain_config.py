@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime
+from functools import cached_property
 import os
 import secrets
+from types import MappingProxyType
 
 class CorporateConfig:
     """
@@ -9,44 +11,61 @@ class CorporateConfig:
     Represents a regional retail chain with seasonal cash flow patterns and expansion strategy.
     """
     
-    def __init__(self):
-        # Core identifiers
-        self.intent_id = str(uuid.uuid4())
-        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
-        self.nonce = secrets.token_hex(16)  # 32-character random hex string
-        self.protocol_version = "WFAP-1.0"
+    # Static profile values, published below as class attributes; from_dict overrides them per instance
+    _DEFAULTS = MappingProxyType({
+        # Core identifiers: created_at is stamped in __init__; intent_id and nonce are random
+        # values generated on first access
+        "protocol_version": "WFAP-1.0",
         
         # Company identifiers
-        self.sender_id = "098765432"  # DUNS number
-        self.sender_name = "Pacific Coast Home & Garden LLC"
-        self.sender_public_jwk_url = "https://api.pchomeandgarden.com/keys/public.jwk"
-        self.company_registration_number = "LLC-2019-4567890"  # California LLC number format
-        self.jurisdiction = "US-CA"  # California, United States
+        "sender_id": "098765432",  # DUNS number
+        "sender_name": "Pacific Coast Home & Garden LLC",
+        "sender_public_jwk_url": "https://api.pchomeandgarden.com/keys/public.jwk",
+        "company_registration_number": "LLC-2019-4567890",  # California LLC number format
+        "jurisdiction": "US-CA",  # California, United States
         
         # Industry and tax information
-        self.industry_code = "444190"  # NAICS code for Other Building Material Dealers
-        self.tax_id = "77-3456789"  # EIN format
-        self.ESG_impact_ratio = "0.5"  # Moderate ESG focus with sustainability initiatives
-        self.carbon_emissions_tons_co2e = 8500  # Moderate emissions for retail chain (stores, transportation, facilities)
+        "industry_code": "444190",  # NAICS code for Other Building Material Dealers
+        "tax_id": "77-3456789",  # EIN format
+        "ESG_impact_ratio": "0.5",  # Moderate ESG focus with sustainability initiatives
+        "carbon_emissions_tons_co2e": 8500,  # Moderate emissions for retail chain (stores, transportation, facilities)
         
         # Financial data (in USD) - Retail chain with seasonal variations
-        self.financials_annual_revenue = 95000000  # $95M
-        self.financials_net_income = 4750000  # $4.75M (5% margin typical for retail)
-        self.financials_assets_total = 78000000  # $78M (inventory heavy)
-        self.financials_liabilities_total = 42000000  # $42M (including seasonal credit lines)
+        "financials_annual_revenue": 95000000,  # $95M
+        "financials_net_income": 4750000,  # $4.75M (5% margin typical for retail)
+        "financials_assets_total": 78000000,  # $78M (inventory heavy)
+        "financials_liabilities_total": 42000000,  # $42M (including seasonal credit lines)
         
         # Credit and ESG information
-        self.credit_report_ref = "DN-33445566"  # D&B reference number
-        self.esg_certifications = "LEED,ENERGY STAR,FAIR TRADE"
-        self.esg_reporting_url = "https://pchomeandgarden.com/sustainability-commitment"
+        "credit_report_ref": "DN-33445566",  # D&B reference number
+        "esg_certifications": "LEED,ENERGY STAR,FAIR TRADE",
+        "esg_reporting_url": "https://pchomeandgarden.com/sustainability-commitment",
         
         # Regulatory information
-        self.regulatory_context_jurisdiction = "CPSC,FTC,California CARB"
-        self.regulatory_context_required_disclosures = "California Prop 65,CPSC Product Safety Reports,FTC Truth in Advertising"
+        "regulatory_context_jurisdiction": "CPSC,FTC,California CARB",
+        "regulatory_context_required_disclosures": "California Prop 65,CPSC Product Safety Reports,FTC Truth in Advertising",
+    })
+    # Every key that to_dict() emits and from_dict() accepts
+    _FIELDS = frozenset(_DEFAULTS) | {"intent_id", "created_at", "nonce"}
+    
+    def __init__(self):
+        # The request timestamp records when the config was built, not when it is first read
+        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
+    
+    @cached_property
+    def intent_id(self):
+        """Unique identifier for this credit request"""
+        return str(uuid.uuid4())
+    
+    @cached_property
+    def nonce(self):
+        """32-character random hex string"""
+        return secrets.token_hex(16)
     
     def to_dict(self):
         """Convert configuration to dictionary"""
-        return {k: v for k, v in self.__dict__.items()}
+        # Fresh dict, so callers may modify it freely; instance overrides win over the shared defaults
+        return {"intent_id": self.intent_id, "created_at": self.created_at, "nonce": self.nonce, **self._DEFAULTS, **self.__dict__}
     
     def from_dict(self, config_dict):
         """
@@ -55,10 +74,13 @@ class CorporateConfig:
         Args:
             config_dict (dict): Dictionary containing configuration values
         """
-        for key, value in config_dict.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        self.__dict__.update({key: value for key, value in config_dict.items() if key in self._FIELDS})
 
     def __str__(self):
         """String representation of configuration"""
-        return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
\ No newline at end of file
+        return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
+
+# Shared defaults are plain class attributes, so instance reads fall through to the class
+for _field, _value in CorporateConfig._DEFAULTS.items():
+    setattr(CorporateConfig, _field, _value)
+del _field, _value
\ No newline at end of file
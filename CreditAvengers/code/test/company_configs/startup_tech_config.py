@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime
+from functools import cached_property
 import os
 import secrets
+from types import MappingProxyType
 
 class CorporateConfig:
     """
@@ -9,44 +11,61 @@ class CorporateConfig:
     Represents a fast-growing SaaS company with aggressive expansion strategy.
     """
     
-    def __init__(self):
-        # Core identifiers
-        self.intent_id = str(uuid.uuid4())
-        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
-        self.nonce = secrets.token_hex(16)  # 32-character random hex string
-        self.protocol_version = "WFAP-1.0"
+    # Static profile values, published below as class attributes; from_dict overrides them per instance
+    _DEFAULTS = MappingProxyType({
+        # Core identifiers: created_at is stamped in __init__; intent_id and nonce are random
+        # values generated on first access
+        "protocol_version": "WFAP-1.0",
         
         # Company identifiers
-        self.sender_id = "087654321"  # DUNS number
-        self.sender_name = "CloudScale AI Inc."
-        self.sender_public_jwk_url = "https://api.cloudscaleai.com/keys/public.jwk"
-        self.company_registration_number = "C87654321"  # Delaware corporation number format
-        self.jurisdiction = "US-DE"  # Delaware, United States
+        "sender_id": "087654321",  # DUNS number
+        "sender_name": "CloudScale AI Inc.",
+        "sender_public_jwk_url": "https://api.cloudscaleai.com/keys/public.jwk",
+        "company_registration_number": "C87654321",  # Delaware corporation number format
+        "jurisdiction": "US-DE",  # Delaware, United States
         
         # Industry and tax information
-        self.industry_code = "541511"  # NAICS code for Custom Computer Programming Services
-        self.tax_id = "85-9876543"  # EIN format
-        self.ESG_impact_ratio = "0.7"  # High ESG focus for modern startup
-        self.carbon_emissions_tons_co2e = 450  # Low emissions for tech startup (office operations, cloud services)
+        "industry_code": "541511",  # NAICS code for Custom Computer Programming Services
+        "tax_id": "85-9876543",  # EIN format
+        "ESG_impact_ratio": "0.7",  # High ESG focus for modern startup
+        "carbon_emissions_tons_co2e": 450,  # Low emissions for tech startup (office operations, cloud services)
         
         # Financial data (in USD) - Series B startup with rapid growth
-        self.financials_annual_revenue = 15000000  # $15M ARR
-        self.financials_net_income = -2500000  # Negative (growth investment phase)
-        self.financials_assets_total = 25000000  # $25M (including cash from funding)
-        self.financials_liabilities_total = 8000000  # $8M
+        "financials_annual_revenue": 15000000,  # $15M ARR
+        "financials_net_income": -2500000,  # Negative (growth investment phase)
+        "financials_assets_total": 25000000,  # $25M (including cash from funding)
+        "financials_liabilities_total": 8000000,  # $8M
         
         # Credit and ESG information
-        self.credit_report_ref = "DN-11223344"  # D&B reference number
-        self.esg_certifications = "B-CORP,CARBON NEUTRAL,ISO14001"
-        self.esg_reporting_url = "https://cloudscaleai.com/sustainability"
+        "credit_report_ref": "DN-11223344",  # D&B reference number
+        "esg_certifications": "B-CORP,CARBON NEUTRAL,ISO14001",
+        "esg_reporting_url": "https://cloudscaleai.com/sustainability",
         
         # Regulatory information
-        self.regulatory_context_jurisdiction = "SEC,SOX"
-        self.regulatory_context_required_disclosures = "409A Valuations,Delaware Annual Report"
+        "regulatory_context_jurisdiction": "SEC,SOX",
+        "regulatory_context_required_disclosures": "409A Valuations,Delaware Annual Report",
+    })
+    # Every key that to_dict() emits and from_dict() accepts
+    _FIELDS = frozenset(_DEFAULTS) | {"intent_id", "created_at", "nonce"}
+    
+    def __init__(self):
+        # The request timestamp records when the config was built, not when it is first read
+        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
+    
+    @cached_property
+    def intent_id(self):
+        """Unique identifier for this credit request"""
+        return str(uuid.uuid4())
+    
+    @cached_property
+    def nonce(self):
+        """32-character random hex string"""
+        return secrets.token_hex(16)
     
     def to_dict(self):
         """Convert configuration to dictionary"""
-        return {k: v for k, v in self.__dict__.items()}
+        # Fresh dict, so callers may modify it freely; instance overrides win over the shared defaults
+        return {"intent_id": self.intent_id, "created_at": self.created_at, "nonce": self.nonce, **self._DEFAULTS, **self.__dict__}
     
     def from_dict(self, config_dict):
         """
@@ -55,10 +74,13 @@ class CorporateConfig:
         Args:
             config_dict (dict): Dictionary containing configuration values
         """
-        for key, value in config_dict.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        self.__dict__.update({key: value for key, value in config_dict.items() if key in self._FIELDS})
 
     def __str__(self):
         """String representation of configuration"""
-        return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
\ No newline at end of file
+        return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
+
+# Shared defaults are plain class attributes, so instance reads fall through to the class
+for _field, _value in CorporateConfig._DEFAULTS.items():
+    setattr(CorporateConfig, _field, _value)
+del _field, _value
\ No newline at end of file
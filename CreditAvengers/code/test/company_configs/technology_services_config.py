@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime
+from functools import cached_property
 import os
 import secrets
+from types import MappingProxyType
 
 class CorporateConfig:
     """
@@ -9,43 +11,60 @@ class CorporateConfig:
     Contains default realistic values for a U.S. corporate company.
     """
     
-    def __init__(self):
-        # Core identifiers
-        self.intent_id = str(uuid.uuid4())
-        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
-        self.nonce = secrets.token_hex(16)  # 32-character random hex string
-        self.protocol_version = "WFAP-1.0"
+    # Static profile values, published below as class attributes; from_dict overrides them per instance
+    _DEFAULTS = MappingProxyType({
+        # Core identifiers: created_at is stamped in __init__; intent_id and nonce are random
+        # values generated on first access
+        "protocol_version": "WFAP-1.0",
         
         # Company identifiers
-        self.sender_id = "073750374"  # Example DUNS number
-        self.sender_name = "Acme Technologies Inc."
-        self.sender_public_jwk_url = "https://api.acmetech.com/keys/public.jwk"
-        self.company_registration_number = "C12345678"  # Delaware corporation number format
-        self.jurisdiction = "US-DE"  # Delaware, United States
+        "sender_id": "073750374",  # Example DUNS number
+        "sender_name": "Acme Technologies Inc.",
+        "sender_public_jwk_url": "https://api.acmetech.com/keys/public.jwk",
+        "company_registration_number": "C12345678",  # Delaware corporation number format
+        "jurisdiction": "US-DE",  # Delaware, United States
         
         # Industry and tax information
-        self.industry_code = "541512"  # NAICS code for Computer Systems Design Services
-        self.tax_id = "84-1234567"  # EIN format
-        self.ESG_impact_ratio = "0.3"
+        "industry_code": "541512",  # NAICS code for Computer Systems Design Services
+        "tax_id": "84-1234567",  # EIN format
+        "ESG_impact_ratio": "0.3",
         
         # Financial data (in USD)
-        self.financials_annual_revenue = 42500000  # $42.5M
-        self.financials_net_income = 6750000  # $6.75M
-        self.financials_assets_total = 65000000  # $65M
-        self.financials_liabilities_total = 28000000  # $28M
+        "financials_annual_revenue": 42500000,  # $42.5M
+        "financials_net_income": 6750000,  # $6.75M
+        "financials_assets_total": 65000000,  # $65M
+        "financials_liabilities_total": 28000000,  # $28M
         
         # Credit and ESG information
-        self.credit_report_ref = "DN-97531864"  # D&B reference number
-        self.esg_certifications = "ISO14001,CDP Climate Change A-,LEED Gold"
-        self.esg_reporting_url = "https://investors.acmetech.com/esg"
+        "credit_report_ref": "DN-97531864",  # D&B reference number
+        "esg_certifications": "ISO14001,CDP Climate Change A-,LEED Gold",
+        "esg_reporting_url": "https://investors.acmetech.com/esg",
         
         # Regulatory information
-        self.regulatory_context_jurisdiction = "SEC,FINRA"
-        self.regulatory_context_required_disclosures = "10-K,10-Q,8-K"
+        "regulatory_context_jurisdiction": "SEC,FINRA",
+        "regulatory_context_required_disclosures": "10-K,10-Q,8-K",
+    })
+    # Every key that to_dict() emits and from_dict() accepts
+    _FIELDS = frozenset(_DEFAULTS) | {"intent_id", "created_at", "nonce"}
+    
+    def __init__(self):
+        # The request timestamp records when the config was built, not when it is first read
+        self.created_at = datetime.utcnow().isoformat() + "Z"  # ISO8601 with Z suffix for UTC
+    
+    @cached_property
+    def intent_id(self):
+        """Unique identifier for this credit request"""
+        return str(uuid.uuid4())
+    
+    @cached_property
+    def nonce(self):
+        """32-character random hex string"""
+        return secrets.token_hex(16)
     
     def to_dict(self):
         """Convert configuration to dictionary"""
-        return {k: v for k, v in self.__dict__.items()}
+        # Fresh dict, so callers may modify it freely; instance overrides win over the shared defaults
+        return {"intent_id": self.intent_id, "created_at": self.created_at, "nonce": self.nonce, **self._DEFAULTS, **self.__dict__}
     
     def from_dict(self, config_dict):
         """
@@ -54,10 +73,13 @@ class CorporateConfig:
         Args:
             config_dict (dict): Dictionary containing configuration values
         """
-        for key, value in config_dict.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        self.__dict__.update({key: value for key, value in config_dict.items() if key in self._FIELDS})
 
     def __str__(self):
         """String representation of configuration"""
         return f"CorporateConfig for {self.sender_name} (ID: {self.sender_id})"
+
+# Shared defaults are plain class attributes, so instance reads fall through to the class
+for _field, _value in CorporateConfig._DEFAULTS.items():
+    setattr(CorporateConfig, _field, _value)
+del _field, _value
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""Tests for the bank policy tools shared by the five bank agents"""
+
+import importlib
+import itertools
+
+import pytest
+import requests
+
+BANK_PACKAGES = [f"bank_agent_{bank}_adk" for bank in range(1, 6)]
+
+HEALTHY_FINANCIALS = (100_000_000, 10_000_000, 50_000_000, 20_000_000)
+
+
+@pytest.fixture(params=BANK_PACKAGES)
+def tools(request):
+    return importlib.import_module(f"{request.param}.bank_policy_tools")
+
+
+# === Initial risk assessment ===
+
+def test_fast_fail_stops_at_first_failed_check(tools):
+    # Zero amount and revenue, a loss and no assets fail checks 2, 4, 5 and 6 under every bank's policies
+    args = ("intent", "Sender", 0, "RU", "211", 0, -1, 0, 5)
+
+    full = tools.perform_initial_risk_assessment(*args)
+    fast = tools.perform_initial_risk_assessment(*args, fast_fail=True)
+
+    statuses = [r["status"] for r in full["detailed_results"]]
+    first_fail = statuses.index("FAIL")
+    assert statuses.count("FAIL") > 1
+    assert fast["overall_status"] == "FAIL"
+    assert fast["detailed_results"] == full["detailed_results"][:first_fail + 1]
+    assert fast["assessment_summary"] == f"Passed {first_fail}/{first_fail + 1} initial risk checks"
+
+
+def test_fast_fail_runs_every_check_when_all_pass(tools):
+    args = ("intent", "Sender", tools.BANK_POLICIES.min_credit_limit, "US", "541511", *HEALTHY_FINANCIALS)
+
+    full = tools.perform_initial_risk_assessment(*args)
+    fast = tools.perform_initial_risk_assessment(*args, fast_fail=True)
+
+    assert fast["overall_status"] == "PASS"
+    assert fast == full
+
+
+def test_batch_assessment_matches_per_row_results(tools):
+    pd = pytest.importorskip("pandas")
+
+    rows = [
+        {
+            "amount_value": amount,
+            "jurisdiction": jurisdiction,
+            "industry_code": industry_code,
+            "financials_annual_revenue": financials[0],
+            "financials_net_income": financials[1],
+            "financials_assets_total": financials[2],
+            "financials_liabilities_total": financials[3],
+        }
+        for amount, jurisdiction, industry_code, financials in itertools.product(
+            [0, 1_000_000, 1e9],
+            ["US", "ru", "XX"],
+            ["541511", "211", "999"],
+            [HEALTHY_FINANCIALS, (1e8, -1, 5e7, 6e7), (0, 0, 0, 0), (3e6, 6e5, 1e6, 1e5)],
+        )
+    ]
+    batch = tools.perform_initial_risk_assessment_batch(pd.DataFrame(rows))
+
+    for row, (_, batch_row) in zip(rows, batch.iterrows()):
+        single = tools.perform_initial_risk_assessment("intent", "Sender", **row)
+        details = single["detailed_results"]
+
+        assert batch_row["overall_status"] == single["overall_status"], row
+        assert [bool(batch_row[column]) for column in tools._BATCH_FAIL_COLUMNS] == [
+            r["status"] == "FAIL" for r in details
+        ], row
+        assert single["assessment_summary"] == f"Passed {batch_row['passed_checks']}/6 initial risk checks", row
+        assert bool(batch_row["manual_review_required"]) == any(
+            r.get("manual_review_required", False) for r in details
+        ), row
+
+
+# === Certification and loan purpose matching ===
+
+@pytest.mark.parametrize("certifications, expected", [
+    ("ISO-14001:2015", {"ISO 14001": 25}),
+    ("B-Corp", {"B-CORP": 40}),
+    ("GRI Standards", {"GRI": 10}),
+    ("Agriculture", {}),
+    ("Integrity, GRIT", {}),
+])
+def test_certification_matching(tools, certifications, expected):
+    score, details = tools.calculate_qualitative_esg_score(certifications)
+
+    assert {c["certification"]: c["points"] for c in details["certifications"]} == expected
+    assert score == sum(expected.values())
+
+
+def test_seasonal_inventory_maps_to_seasonal_financing(tools):
+    assert tools.normalize_loan_purpose("seasonal inventory") == "seasonal_financing"
+    assert tools.normalize_loan_purpose("Seasonal Inventory") == "seasonal_financing"
+
+
+# === ESG report fetching ===
+
+class _FakeResponse:
+    """Minimal stand-in for a streamed requests.Response"""
+
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+        self._body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start:start + chunk_size]
+
+
+def test_not_modified_report_reuses_cached_emissions(tools, monkeypatch):
+    url = "https://example.com/esg-report.txt"
+    responses = [
+        _FakeResponse(200, b"Total Emissions: 5\nCarbon Emissions: 450\n", {"ETag": '"v1"'}),
+        _FakeResponse(304),
+    ]
+    sent_headers = []
+
+    def fake_get(request_url, headers, timeout, stream):
+        sent_headers.append(dict(headers))
+        return responses.pop(0)
+
+    monkeypatch.setattr(tools, "_ESG_REPORT_CACHE", {})
+    monkeypatch.setattr(tools._SESSION, "get", fake_get)
+
+    assert tools.fetch_carbon_emissions_from_esg_report(url) == 450.0
+    assert tools.fetch_carbon_emissions_from_esg_report(url) == 450.0
+    assert sent_headers == [{}, {"If-None-Match": '"v1"'}]
+
+
+# === Score bands ===
+
+def test_nan_scores_fall_in_the_lowest_band(tools):
+    nan = float("nan")
+
+    assert tools.get_risk_category_from_score(nan) == tools.get_risk_category_from_score(1.0)
+    assert tools.get_financial_risk_adjustment(nan) == tools.get_financial_risk_adjustment(1.0)
+    assert tools.get_esg_category_from_score(nan) == "ESG Laggard"
+    assert tools.get_esg_opportunity_adjustment(nan) == tools.get_esg_opportunity_adjustment(0)
+    assert tools.get_risk_premium_from_score(nan) == tools.get_risk_premium_from_score(1.0)
+
+
+def test_batch_risk_categories_match_scalar_bands(tools):
+    pytest.importorskip("numpy")
+    scores = [float("nan"), 1.0, 1.5, 2.49, 2.5, 3.5, 4.49, 4.5, 5.0]
+
+    assert list(tools.categorize_risk_scores(scores)) == [tools.get_risk_category_from_score(s) for s in scores]